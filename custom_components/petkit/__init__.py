@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from functools import partial
+import time
+from typing import TYPE_CHECKING, Any
 
 from aiohttp import web
 from pypetkitapi import PetKitClient
@@ -47,6 +50,8 @@ from .coordinator import (
 from .data import PetkitData
 
 if TYPE_CHECKING:
+    from pypetkitapi import IotInfo
+
     from homeassistant.core import HomeAssistant
 
     from .data import PetkitConfigEntry
@@ -65,6 +70,58 @@ PLATFORMS: list[Platform] = [
     Platform.FAN,
 ]
 
+_MQTT_DUMP_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entry_id"): str,
+        vol.Optional("limit", default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=200)
+        ),
+        vol.Optional("topic_contains"): str,
+    }
+)
+
+# Seconds during which a validated session is reused without a new round-trip
+SESSION_VALIDATION_TTL = 60.0
+
+_VIEWS_REGISTERED = False
+_SESSION_VALIDATED_AT: dict[int, float] = {}
+_IOT_INFLIGHT: dict[int, asyncio.Task] = {}
+
+
+async def _async_validate_session(client: PetKitClient) -> None:
+    """Validate the client session, unless it was validated recently."""
+    cid = id(client)
+    validated_at = _SESSION_VALIDATED_AT.get(cid)
+    if (
+        validated_at is not None
+        and time.monotonic() - validated_at < SESSION_VALIDATION_TTL
+    ):
+        return
+    await client.validate_session()
+    _SESSION_VALIDATED_AT[cid] = time.monotonic()
+
+
+def _iot_fetch_done(cid: int, task: asyncio.Task[IotInfo]) -> None:
+    """Drop a finished IoT config fetch and mark its exception as retrieved."""
+    _IOT_INFLIGHT.pop(cid, None)
+    if not task.cancelled():
+        task.exception()
+
+
+async def _async_get_iot_config(
+    hass: HomeAssistant, entry: PetkitConfigEntry, client: PetKitClient
+) -> IotInfo:
+    """Fetch the IoT MQTT config, sharing any fetch already in flight."""
+    cid = id(client)
+    task = _IOT_INFLIGHT.get(cid)
+    if task is None:
+        task = entry.async_create_background_task(
+            hass, client.get_iot_mqtt_config(), f"petkit_iot_config_{entry.entry_id}"
+        )
+        _IOT_INFLIGHT[cid] = task
+        task.add_done_callback(partial(_iot_fetch_done, cid))
+    return await asyncio.shield(task)
+
 
 class PetkitSessionView(HomeAssistantView):
     """Expose PetKit session tokens for external consumers (e.g. Scrypted)."""
@@ -78,7 +135,7 @@ class PetkitSessionView(HomeAssistantView):
         hass = request.app["hass"]
         username_filter = request.query.get("username")
 
-        sessions = []
+        candidates = []
         for entry in hass.config_entries.async_entries(DOMAIN):
             runtime = getattr(entry, "runtime_data", None)
             if not runtime or not runtime.client:
@@ -89,7 +146,25 @@ class PetkitSessionView(HomeAssistantView):
             if username_filter and account_username != username_filter:
                 continue
 
-            await client.validate_session()
+            candidates.append((entry, client, account_username))
+            if username_filter:
+                # Only the first matching account is returned
+                break
+
+        results = await asyncio.gather(
+            *(_async_validate_session(client) for _, client, _ in candidates),
+            return_exceptions=True,
+        )
+
+        sessions = []
+        for (entry, client, account_username), result in zip(
+            candidates, results, strict=True
+        ):
+            if isinstance(result, Exception):
+                LOGGER.debug(
+                    "Session validation failed for %s: %s", account_username, result
+                )
+                continue
             if client._session:
                 sessions.append({
                     "username": account_username,
@@ -123,7 +198,7 @@ class PetkitIotView(HomeAssistantView):
         hass = request.app["hass"]
         username_filter = request.query.get("username")
 
-        results = []
+        candidates = []
         for entry in hass.config_entries.async_entries(DOMAIN):
             runtime = getattr(entry, "runtime_data", None)
             if not runtime or not runtime.client:
@@ -134,21 +209,35 @@ class PetkitIotView(HomeAssistantView):
             if username_filter and account_username != username_filter:
                 continue
 
-            try:
-                iot = await client.get_iot_mqtt_config()
-                results.append({
-                    "username": account_username,
-                    "deviceName": iot.device_name,
-                    "deviceSecret": iot.device_secret,
-                    "productKey": iot.product_key,
-                    "mqttHost": iot.mqtt_host,
-                    "iotInstanceId": iot.iot_instance_id,
-                })
-            except Exception as err:  # noqa: BLE001
+            candidates.append((entry, client, account_username))
+            if username_filter:
+                # Only the first matching account is returned
+                break
+
+        iot_configs = await asyncio.gather(
+            *(
+                _async_get_iot_config(hass, entry, client)
+                for entry, client, _ in candidates
+            ),
+            return_exceptions=True,
+        )
+
+        results = []
+        for (_, _, account_username), iot in zip(candidates, iot_configs, strict=True):
+            if isinstance(iot, Exception):
                 results.append({
                     "username": account_username,
-                    "error": str(err),
+                    "error": str(iot),
                 })
+                continue
+            results.append({
+                "username": account_username,
+                "deviceName": iot.device_name,
+                "deviceSecret": iot.device_secret,
+                "productKey": iot.product_key,
+                "mqttHost": iot.mqtt_host,
+                "iotInstanceId": iot.iot_instance_id,
+            })
 
         if username_filter:
             if not results:
@@ -169,9 +258,13 @@ async def async_setup_entry(
 ) -> bool:
     """Set up this integration using UI."""
 
-    # Register API views once (idempotent — HA deduplicates by name)
-    hass.http.register_view(PetkitSessionView())
-    hass.http.register_view(PetkitIotView())
+    global _VIEWS_REGISTERED  # noqa: PLW0603
+
+    # Register API views once per process, not on every entry setup
+    if not _VIEWS_REGISTERED:
+        hass.http.register_view(PetkitSessionView())
+        hass.http.register_view(PetkitIotView())
+        _VIEWS_REGISTERED = True
 
     country_from_ha = hass.config.country
     tz_from_ha = hass.config.time_zone
@@ -215,11 +308,15 @@ async def async_setup_entry(
         coordinator=coordinator,
         coordinator_media=coordinator_media,
         coordinator_bluetooth=coordinator_bluetooth,
+        config_snapshot=(dict(entry.data), dict(entry.options)),
     )
 
     await coordinator.async_config_entry_first_refresh()
-    await coordinator_media.async_config_entry_first_refresh()
-    await coordinator_bluetooth.async_config_entry_first_refresh()
+    # Media and bluetooth refreshes read the device list from the main coordinator
+    await asyncio.gather(
+        coordinator_media.async_config_entry_first_refresh(),
+        coordinator_bluetooth.async_config_entry_first_refresh(),
+    )
 
     if entry.options.get(CONF_REALTIME_MQTT, DEFAULT_REALTIME_MQTT):
         from .iot_mqtt import PetkitIotMqttListener
@@ -233,16 +330,6 @@ async def async_setup_entry(
         await mqtt_listener.async_start()
 
     if not hass.services.has_service(DOMAIN, SERVICE_MQTT_DUMP):
-        schema = vol.Schema(
-            {
-                vol.Optional("entry_id"): str,
-                vol.Optional("limit", default=1): vol.All(
-                    vol.Coerce(int), vol.Range(min=1, max=200)
-                ),
-                vol.Optional("topic_contains"): str,
-            }
-        )
-
         async def _async_mqtt_dump(call):  # noqa: ANN001
             target_entry_id = call.data.get("entry_id")
             limit = call.data["limit"]
@@ -274,13 +361,12 @@ async def async_setup_entry(
                     **diag,
                 })
 
-                for msg in listener.get_recent_messages(
-                    limit=limit, topic_contains=topic_contains
-                ):
-                    enriched = dict(msg)
-                    enriched["entry_id"] = ent.entry_id
-                    enriched["account"] = ent.title
-                    messages.append(enriched)
+                messages.extend(
+                    {**msg, "entry_id": ent.entry_id, "account": ent.title}
+                    for msg in listener.get_recent_messages(
+                        limit=limit, topic_contains=topic_contains
+                    )
+                )
 
             result = {"accounts": accounts, "messages": messages}
             hass.bus.async_fire(EVENT_MQTT_DUMP, result)
@@ -290,19 +376,18 @@ async def async_setup_entry(
             DOMAIN,
             SERVICE_MQTT_DUMP,
             _async_mqtt_dump,
-            schema=schema,
+            schema=_MQTT_DUMP_SCHEMA,
             supports_response=SupportsResponse.OPTIONAL,
         )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {}
-
-    hass.data[DOMAIN][COORDINATOR] = coordinator
-    hass.data[DOMAIN][COORDINATOR_MEDIA] = coordinator
-    hass.data[DOMAIN][COORDINATOR_BLUETOOTH] = coordinator
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        COORDINATOR: coordinator,
+        COORDINATOR_MEDIA: coordinator_media,
+        COORDINATOR_BLUETOOTH: coordinator_bluetooth,
+    }
 
     return True
 
@@ -312,25 +397,74 @@ async def async_unload_entry(
     entry: PetkitConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
+    _SESSION_VALIDATED_AT.pop(id(entry.runtime_data.client), None)
+
     mqtt_listener = getattr(entry.runtime_data, "mqtt_listener", None)
     if mqtt_listener is not None:
         await mqtt_listener.async_stop()
 
+    hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+def _strip_scan_intervals(options: dict[str, Any]) -> dict[str, Any]:
+    """Return options without the scan interval keys."""
+    stripped = dict(options)
+    stripped.pop(CONF_SCAN_INTERVAL, None)
+    for section, key in (
+        (MEDIA_SECTION, CONF_SCAN_INTERVAL_MEDIA),
+        (BT_SECTION, CONF_SCAN_INTERVAL_BLUETOOTH),
+    ):
+        section_options = dict(stripped.get(section) or {})
+        section_options.pop(key, None)
+        stripped[section] = section_options
+    return stripped
+
+
+def _async_apply_scan_intervals(entry: PetkitConfigEntry) -> bool:
+    """Apply scan interval changes in place.
+
+    Return False when anything else changed and a full reload is required.
+    """
+    runtime = entry.runtime_data
+    if runtime.config_snapshot is None:
+        return False
+
+    previous_data, previous_options = runtime.config_snapshot
+    options = dict(entry.options)
+    if dict(entry.data) != previous_data or _strip_scan_intervals(
+        options
+    ) != _strip_scan_intervals(previous_options):
+        return False
+
+    runtime.coordinator.update_interval = timedelta(seconds=options[CONF_SCAN_INTERVAL])
+    runtime.coordinator_media.update_interval = timedelta(
+        minutes=options[MEDIA_SECTION][CONF_SCAN_INTERVAL_MEDIA]
+    )
+    runtime.coordinator_bluetooth.update_interval = timedelta(
+        minutes=options[BT_SECTION][CONF_SCAN_INTERVAL_BLUETOOTH]
+    )
+    runtime.config_snapshot = (previous_data, options)
+    LOGGER.debug("Scan intervals updated without reloading %s", entry.title)
+    return True
+
+
 async def async_reload_entry(
     hass: HomeAssistant,
     entry: PetkitConfigEntry,
 ) -> None:
     """Reload config entry."""
+    if _async_apply_scan_intervals(entry):
+        return
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
 
 
 async def async_update_options(hass: HomeAssistant, entry: PetkitConfigEntry) -> None:
     """Update options."""
-
+    if _async_apply_scan_intervals(entry):
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
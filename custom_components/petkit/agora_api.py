@@ -7,14 +7,31 @@ import hashlib
 import json
 import logging
 import time
-from dataclasses import dataclass
-from random import randint
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import zip_longest
+from random import getrandbits
 from typing import Any
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
+if orjson is not None:
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
 # Service IDs in request payload (request_bodies[].buffer.service_ids)
 SERVICE_IDS: dict[str, int] = {
     "CHOOSE_SERVER": 11,
@@ -31,13 +48,28 @@ RESPONSE_FLAGS: dict[str, int] = {
     "CLOUD_PROXY_FALLBACK": 4194310,
 }
 
+# Hedged choose-server requests: delay before racing the next endpoint, and cap
+# on concurrent in-flight attempts.
+HEDGE_DELAY_SECONDS = 0.5
+MAX_INFLIGHT_REQUESTS = 2
+
+_CHOOSE_SERVER_FLAG = RESPONSE_FLAGS["CHOOSE_SERVER"]
+_FALLBACK_FLAG = RESPONSE_FLAGS["CLOUD_PROXY_FALLBACK"]
+_EMPTY_DICT: dict[str, Any] = {}
+
+
+@lru_cache(maxsize=512)
+def _sha256_hex(value: str) -> str:
+    """Return the hex SHA-256 digest of a string."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
 
 def derive_password(uid: int | str) -> str:
     """Derive TURN password from Agora uid."""
-    return hashlib.sha256(str(uid).encode("utf-8")).hexdigest()
+    return _sha256_hex(str(uid))
 
 
-@dataclass
+@dataclass(slots=True)
 class EdgeAddress:
     """Agora edge address entry."""
 
@@ -49,7 +81,7 @@ class EdgeAddress:
     fingerprint: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ICEServer:
     """RTCIceServer-like structure."""
 
@@ -58,7 +90,7 @@ class ICEServer:
     credential: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgoraResponse:
     """Parsed Agora choose-server response."""
 
@@ -73,6 +105,9 @@ class AgoraResponse:
     flag: int
     opid: int
     responses: dict[int, dict[str, Any]] | None = None
+    _ice_cache: dict[tuple[bool, int], list[ICEServer]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     @classmethod
     def from_api_response(cls, response_data: dict[str, Any]) -> "AgoraResponse":
@@ -81,12 +116,14 @@ class AgoraResponse:
         if not response_body:
             raise ValueError("Agora response_body is empty")
 
-        detail_base = response_data.get("detail", {}) or {}
+        detail_base = response_data.get("detail") or _EMPTY_DICT
         responses_by_flag: dict[int, dict[str, Any]] = {}
 
         for response_item in response_body:
-            buffer = response_item.get("buffer", {}) or {}
-            code = int(buffer.get("code", -1))
+            buffer = response_item.get("buffer") or _EMPTY_DICT
+            code = buffer.get("code", -1)
+            if type(code) is not int:
+                code = int(code)
             if code != 0:
                 LOGGER.debug(
                     "Skipping Agora response buffer with non-zero code=%s flag=%s",
@@ -95,15 +132,24 @@ class AgoraResponse:
                 )
                 continue
 
-            flag = int(buffer.get("flag", 0))
-            uid = int(buffer.get("uid", 0))
-            ticket = str(buffer.get("cert", ""))
+            flag = buffer.get("flag", 0)
+            if type(flag) is not int:
+                flag = int(flag)
+            uid = buffer.get("uid", 0)
+            if type(uid) is not int:
+                uid = int(uid)
+            ticket = buffer.get("cert", "")
+            if type(ticket) is not str:
+                ticket = str(ticket)
             edges_services = buffer.get("edges_services", []) or []
 
-            detail = {
-                **detail_base,
-                **(buffer.get("detail", {}) or {}),
-            }
+            # Shared when the buffer adds nothing; detail dicts are never mutated
+            buffer_detail = buffer.get("detail")
+            if buffer_detail:
+                detail = detail_base.copy()
+                detail.update(buffer_detail)
+            else:
+                detail = detail_base
 
             username = str(detail.get("8", "") or "")
             credentials = str(detail.get("4", "") or "")
@@ -128,15 +174,15 @@ class AgoraResponse:
 
             addresses = [
                 EdgeAddress(
-                    ip=str(edge.get("ip", "")),
-                    port=int(edge.get("port", 0)),
+                    ip=str(ip),
+                    port=int(port),
                     username=username,
                     credentials=credentials,
                     ticket=ticket,
-                    fingerprint=fingerprints[index] if index < len(fingerprints) else None,
+                    fingerprint=fingerprint,
                 )
-                for index, edge in enumerate(edges_services)
-                if edge.get("ip") and edge.get("port")
+                for edge, fingerprint in zip_longest(edges_services, fingerprints)
+                if edge and (ip := edge.get("ip")) and (port := edge.get("port"))
             ]
 
             responses_by_flag[flag] = {
@@ -153,7 +199,7 @@ class AgoraResponse:
         if not responses_by_flag:
             raise ValueError("Agora API response did not contain a successful buffer")
 
-        primary = responses_by_flag.get(RESPONSE_FLAGS["CHOOSE_SERVER"])
+        primary = responses_by_flag.get(_CHOOSE_SERVER_FLAG)
         if primary is None:
             primary = next(iter(responses_by_flag.values()))
 
@@ -180,20 +226,20 @@ class AgoraResponse:
     def get_gateway_addresses(self) -> list[EdgeAddress]:
         """Return gateway addresses (flag 4096)."""
         if self.responses:
-            response = self.responses.get(RESPONSE_FLAGS["CHOOSE_SERVER"])
+            response = self.responses.get(_CHOOSE_SERVER_FLAG)
             if response:
                 return response.get("addresses", [])
-        if self.flag == RESPONSE_FLAGS["CHOOSE_SERVER"]:
+        if self.flag == _CHOOSE_SERVER_FLAG:
             return self.addresses
         return []
 
     def get_turn_addresses(self) -> list[EdgeAddress]:
         """Return TURN addresses (flag 4194310)."""
         if self.responses:
-            response = self.responses.get(RESPONSE_FLAGS["CLOUD_PROXY_FALLBACK"])
+            response = self.responses.get(_FALLBACK_FLAG)
             if response:
                 return response.get("addresses", [])
-        if self.flag == RESPONSE_FLAGS["CLOUD_PROXY_FALLBACK"]:
+        if self.flag == _FALLBACK_FLAG:
             return self.addresses
         return []
 
@@ -203,6 +249,11 @@ class AgoraResponse:
         new_turn_mode: int = 4,
     ) -> list[ICEServer]:
         """Convert TURN endpoints into RTCIceServer objects."""
+        key = (use_all_turn_servers, new_turn_mode)
+        cached = self._ice_cache.get(key)
+        if cached is not None:
+            return cached
+
         turn_addresses = self.get_turn_addresses() or self.addresses
         if not turn_addresses:
             return []
@@ -228,18 +279,16 @@ class AgoraResponse:
                     )
                 )
             if new_turn_mode in (3, 4):
+                edge_host = address.ip.replace(".", "-")
                 servers.append(
                     ICEServer(
-                        urls=(
-                            "turns:"
-                            f"{address.ip.replace('.', '-')}.edge.agora.io:443"
-                            "?transport=tcp"
-                        ),
+                        urls=f"turns:{edge_host}.edge.agora.io:443?transport=tcp",
                         username=address.username,
                         credential=address.credentials,
                     )
                 )
 
+        self._ice_cache[key] = servers
         return servers
 
     def to_ap_response(self, flag: int | None = None) -> dict[str, Any]:
@@ -287,6 +336,7 @@ class AgoraAPIClient:
         "webrtc2-ap-web-5.agora.io",
         "webrtc2-ap-web-6.agora.io",
     ]
+    _ALL_DOMAINS: tuple[str, ...] = (*WEBCS_DOMAIN, *WEBCS_DOMAIN_BACKUP)
 
     def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
         """Initialize API client."""
@@ -299,8 +349,26 @@ class AgoraAPIClient:
 
     async def __aexit__(self, exc_type, exc, traceback) -> None:
         """Context manager exit."""
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close the HTTP session if it is owned by this client."""
         if self._own_session and self.session:
             await self.session.close()
+            self.session = None
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating a pooled one on first use."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=8,
+                    ttl_dns_cache=300,
+                    force_close=False,
+                )
+            )
+            self._own_session = True
+        return self.session
 
     async def choose_server(
         self,
@@ -324,7 +392,7 @@ class AgoraAPIClient:
                 SERVICE_IDS["CLOUD_PROXY_FALLBACK"],
             ]
         if sid is None:
-            sid = str(randint(0, 2**31 - 1))
+            sid = str(getrandbits(31))
 
         payload = self._build_request_payload(
             app_id=app_id,
@@ -341,17 +409,6 @@ class AgoraAPIClient:
         response = await self._make_api_call(payload, proxy_server=proxy_server)
         return AgoraResponse.from_api_response(response)
 
-    @staticmethod
-    def _merge_objects(*objects: dict[str, Any] | None) -> dict[str, Any]:
-        merged: dict[str, Any] = {}
-        for obj in objects:
-            if obj is None:
-                continue
-            for key, value in obj.items():
-                if value is not None:
-                    merged[key] = value
-        return merged
-
     def _build_request_payload(
         self,
         app_id: str,
@@ -365,16 +422,15 @@ class AgoraAPIClient:
         role: int,
         area_code: str,
     ) -> dict[str, Any]:
-        client_ts = int(time.time() * 1000)
-        opid = randint(0, 10**12 - 1)
+        client_ts = time.time_ns() // 1_000_000
+        opid = getrandbits(40)
 
-        detail = self._merge_objects(
-            {"11": area_code},
-            {"17": str(role)} if role else None,
-            {"22": area_code},
+        detail: dict[str, Any] = {"11": area_code, "22": area_code}
+        if role:
+            detail["17"] = str(role)
+        if string_uid:
             # Included to match Agora SDK behavior.
-            {"6": string_uid} if string_uid else None,
-        )
+            detail["6"] = string_uid
 
         return {
             "appid": app_id,
@@ -400,32 +456,61 @@ class AgoraAPIClient:
         request_payload: dict[str, Any],
         proxy_server: str | None = None,
     ) -> dict[str, Any]:
-        session = self.session
-        should_close = False
-        if session is None:
-            session = aiohttp.ClientSession()
-            if self._own_session:
-                self.session = session
-            else:
-                should_close = True
-
+        session = self._ensure_session()
+        domains = iter(self._ALL_DOMAINS)
+        exhausted = False
+        tasks: dict[asyncio.Task, str] = {}
         try:
-            for domain in [*self.WEBCS_DOMAIN, *self.WEBCS_DOMAIN_BACKUP]:
-                try:
-                    return await self._call_endpoint(
-                        session,
-                        domain,
-                        request_payload,
-                        proxy_server,
-                    )
-                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
-                    LOGGER.debug("Agora endpoint %s failed: %s", domain, err)
-                    continue
+            while True:
+                if not exhausted and len(tasks) < MAX_INFLIGHT_REQUESTS:
+                    domain = next(domains, None)
+                    if domain is None:
+                        exhausted = True
+                    else:
+                        task = asyncio.create_task(
+                            self._call_endpoint(
+                                session,
+                                domain,
+                                request_payload,
+                                proxy_server,
+                            )
+                        )
+                        tasks[task] = domain
+                if not tasks:
+                    break
+
+                can_hedge = not exhausted and len(tasks) < MAX_INFLIGHT_REQUESTS
+                done, _ = await asyncio.wait(
+                    tasks,
+                    timeout=HEDGE_DELAY_SECONDS if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                # Several tasks can finish together; retrieve every outcome so
+                # no sibling exception is left unobserved
+                results: list[dict[str, Any]] = []
+                unexpected: BaseException | None = None
+                for task in done:
+                    domain = tasks.pop(task)
+                    err = task.exception()
+                    if err is None:
+                        results.append(task.result())
+                    elif isinstance(
+                        err, (aiohttp.ClientError, asyncio.TimeoutError, ValueError)
+                    ):
+                        LOGGER.debug("Agora endpoint %s failed: %s", domain, err)
+                    elif unexpected is None:
+                        unexpected = err
+                if results:
+                    return results[0]
+                if unexpected is not None:
+                    raise unexpected
 
             raise RuntimeError("All Agora endpoints failed")
         finally:
-            if should_close:
-                await session.close()
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _call_endpoint(
         self,
@@ -445,7 +530,7 @@ class AgoraAPIClient:
         form_data = aiohttp.FormData()
         form_data.add_field(
             "request",
-            json.dumps(request_payload),
+            _dumps(request_payload),
             content_type="application/json",
         )
 
@@ -460,4 +545,4 @@ class AgoraAPIClient:
                     f"Agora API returned status={response.status}: "
                     f"{await response.text()}"
                 )
-            return await response.json()
+            return _loads(await response.read())
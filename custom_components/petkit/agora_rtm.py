@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterator
 import json
 from typing import Any
 from urllib.parse import quote
@@ -12,6 +13,21 @@ from pypetkitapi import LiveFeed
 
 from .const import LOGGER
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
 HEARTBEAT_INTERVAL_SECONDS = 0.5
 START_LIVE_RETRIES = 5
 START_LIVE_RETRY_DELAY_SECONDS = 1.0
@@ -25,15 +41,21 @@ SIGNALING_DOMAINS = [
 SIGNALING_PATHS = [
     "/dev/v2/project/{app_id}/rtm/users/{user_id}/peer_messages",
 ]
-SUCCESS_CODES = {
-    "message_sent",
-    "message_delivered",
-}
-STOP_SUCCESS_CODES = {
-    "message_sent",
-    "message_delivered",
-    "message_offline",
-}
+SUCCESS_CODES = frozenset(
+    {
+        "message_sent",
+        "message_delivered",
+    }
+)
+STOP_SUCCESS_CODES = frozenset(
+    {
+        "message_sent",
+        "message_delivered",
+        "message_offline",
+    }
+)
+# Statuses below 500 that are retried on the next endpoint
+TRANSIENT_STATUS_CODES = frozenset({404, 429})
 
 
 class AgoraRTMSignaling:
@@ -50,10 +72,25 @@ class AgoraRTMSignaling:
 
         self._session: aiohttp.ClientSession | None = None
         self._state_lock = asyncio.Lock()
-        self._send_lock = asyncio.Lock()
         self._heartbeat_task: asyncio.Task[None] | None = None
         self._preferred_domain: str | None = None
         self._preferred_path: str | None = None
+        # (domain, path template, url) candidates for the current app user
+        self._endpoint_urls: tuple[tuple[str, str, str], ...] = ()
+        # Last endpoint that accepted a command; tried alone until it fails
+        self._pinned_endpoint: tuple[str, str, str] | None = None
+        # Pre-encoded request bodies and headers for the current credentials
+        self._cached_bodies: dict[str, bytes] = {}
+        self._headers: dict[str, str] = {}
+
+    @property
+    def is_active(self) -> bool:
+        """Return True while signaling holds state that stop_live must clear."""
+        return (
+            self._app_user_id is not None
+            or self._heartbeat_task is not None
+            or self._state_lock.locked()
+        )
 
     async def start_live(self, live_feed: LiveFeed) -> bool:
         """Start signaling and begin live heartbeat loop."""
@@ -83,6 +120,14 @@ class AgoraRTMSignaling:
         async with self._state_lock:
             await self._teardown_locked(send_stop=send_stop)
 
+    async def async_close(self) -> None:
+        """Stop signaling and close the pooled HTTP session."""
+        async with self._state_lock:
+            await self._teardown_locked(send_stop=False)
+            if self._session and not self._session.closed:
+                await self._session.close()
+            self._session = None
+
     async def update_tokens(self, live_feed: LiveFeed) -> None:
         """Update in-memory signaling token from refreshed live feed."""
         credentials = self._extract_rtm_credentials(live_feed)
@@ -90,12 +135,15 @@ class AgoraRTMSignaling:
             return
 
         app_user_id, device_user_id, token = credentials
-        async with self._state_lock:
-            if (
-                self._app_user_id == app_user_id
-                and self._device_user_id == device_user_id
-            ):
-                self._token = token
+        # No await between the compare and the swap, so the state lock is not
+        # needed; the headers dict is replaced rather than mutated in place
+        if (
+            self._app_user_id == app_user_id
+            and self._device_user_id == device_user_id
+            and self._token != token
+        ):
+            self._token = token
+            self._build_headers()
 
     @staticmethod
     def _extract_rtm_credentials(
@@ -131,14 +179,30 @@ class AgoraRTMSignaling:
         self._app_user_id = app_user_id
         self._device_user_id = device_user_id
         self._token = token
+        self._pinned_endpoint = None
+        self._build_endpoint_urls()
+        self._build_headers()
+        self._cached_bodies = {
+            "start_live": self._encode_body("start_live", {"isSD": self._is_sd}),
+            "live_heartbeat": self._encode_body(
+                "live_heartbeat", {"isSD": self._is_sd}
+            ),
+            "stop_live": self._encode_body("stop_live", None),
+        }
         await self._ensure_session()
 
     async def _ensure_session(self) -> None:
-        """Create aiohttp session lazily."""
+        """Create aiohttp session lazily; it is kept across start/stop cycles."""
         if self._session and not self._session.closed:
             return
         self._session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+            connector=aiohttp.TCPConnector(
+                limit=4,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
         )
 
     async def _send_start_live_with_retry(self) -> bool:
@@ -146,10 +210,11 @@ class AgoraRTMSignaling:
         for attempt in range(START_LIVE_RETRIES):
             sent = await self._send_command(
                 command="start_live",
-                payload={"isSD": self._is_sd},
                 wait_for_ack=True,
                 accepted_codes=SUCCESS_CODES,
                 suppress_errors=True,
+                # Only the first attempt is hedged to bound the extra load
+                hedge=attempt == 0,
             )
             if sent:
                 return True
@@ -166,12 +231,22 @@ class AgoraRTMSignaling:
     async def _send_command(
         self,
         command: str,
+        *,
         payload: dict[str, Any] | None = None,
         wait_for_ack: bool = False,
-        accepted_codes: set[str] | None = None,
+        accepted_codes: frozenset[str] | None = None,
         suppress_errors: bool = False,
+        hedge: bool = False,
     ) -> bool:
-        """Send one signaling command to the PetKit device peer."""
+        """Send one signaling command to the PetKit device peer.
+
+        start_live, live_heartbeat and stop_live are sent with the bodies
+        pre-encoded in _ensure_state when no payload is given; an explicit
+        payload is always encoded as passed.
+
+        With hedge set, the first endpoint of every signaling domain is tried in
+        parallel before falling back to the remaining endpoints one by one.
+        """
         if (
             self._session is None
             or self._session.closed
@@ -181,108 +256,265 @@ class AgoraRTMSignaling:
         ):
             return False
 
-        message_data: dict[str, Any] = {"cmd": command}
-        if payload is not None:
-            message_data["payload"] = payload
-
-        message = json.dumps(message_data, separators=(",", ":"))
-        request_body = {
-            "destination": self._device_user_id,
-            "enable_offline_messaging": False,
-            "enable_historical_messaging": False,
-            "payload": message,
-        }
+        body = self._cached_bodies.get(command) if payload is None else None
+        if body is None:
+            body = self._encode_body(command, payload)
 
-        headers = {
-            "Content-Type": "application/json",
-            "x-agora-token": self._token,
-            "x-agora-uid": self._app_user_id,
-            "Authorization": f"agora token={self._token}",
-        }
         if accepted_codes is None:
             accepted_codes = SUCCESS_CODES
 
         query = "?wait_for_ack=true" if wait_for_ack else ""
 
-        for domain, path_template in self._iter_endpoints():
-            encoded_user_id = quote(self._app_user_id, safe="")
-            path = path_template.format(
-                app_id=self._app_id,
-                user_id=encoded_user_id,
-            )
-            url = f"https://{domain}{path}{query}"
-
-            try:
-                async with self._send_lock:
-                    async with self._session.post(
-                        url,
-                        json=request_body,
-                        headers=headers,
-                    ) as response:
-                        response_text = await response.text()
-            except (aiohttp.ClientError, TimeoutError) as err:
-                LOGGER.debug(
-                    "Signaling request failed for %s on %s: %s",
+        tried: tuple[tuple[str, str, str], ...] = ()
+        if hedge:
+            tried = self._hedge_endpoints()
+            if len(tried) > 1:
+                outcome = await self._post_hedged(
                     command,
-                    url,
-                    err,
+                    tried,
+                    body=body,
+                    query=query,
+                    accepted_codes=accepted_codes,
+                    suppress_errors=suppress_errors,
                 )
+                if outcome is not None:
+                    return outcome
+            else:
+                tried = ()
+
+        for endpoint in self._iter_endpoints():
+            if endpoint in tried:
+                continue
+            outcome = await self._post_command(
+                command,
+                endpoint,
+                body=body,
+                query=query,
+                accepted_codes=accepted_codes,
+                suppress_errors=suppress_errors,
+            )
+            if outcome is None:
                 continue
+            if outcome:
+                self._mark_endpoint_good(endpoint)
+            return outcome
 
-            data: dict[str, Any] = {}
-            if response_text:
-                try:
-                    data = json.loads(response_text)
-                except json.JSONDecodeError:
-                    data = {}
+        log_fn = LOGGER.debug if suppress_errors else LOGGER.warning
+        log_fn("Signaling command %s failed on all endpoints", command)
+        return False
 
-            if response.status == 404:
-                continue
+    async def _post_hedged(
+        self,
+        command: str,
+        endpoints: tuple[tuple[str, str, str], ...],
+        *,
+        body: bytes,
+        query: str,
+        accepted_codes: frozenset[str],
+        suppress_errors: bool,
+    ) -> bool | None:
+        """Race one command across endpoints and keep the first acceptance.
+
+        Returns None when every endpoint failed transiently so the caller can
+        fall back to the remaining candidates.
+        """
+        tasks = {
+            asyncio.create_task(
+                self._post_command(
+                    command,
+                    endpoint,
+                    body=body,
+                    query=query,
+                    accepted_codes=accepted_codes,
+                    suppress_errors=suppress_errors,
+                )
+            ): endpoint
+            for endpoint in endpoints
+        }
+        rejected = False
+        pending: set[asyncio.Task] = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Read every finished outcome before picking a winner so none
+                # is left unretrieved
+                winner: tuple[str, str, str] | None = None
+                unexpected: BaseException | None = None
+                for task in done:
+                    if (err := task.exception()) is not None:
+                        unexpected = unexpected or err
+                        continue
+                    outcome = task.result()
+                    if outcome and winner is None:
+                        winner = tasks[task]
+                    elif outcome is False:
+                        rejected = True
+                if winner is not None:
+                    self._mark_endpoint_good(winner)
+                    return True
+                if unexpected is not None:
+                    raise unexpected
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return False if rejected else None
+
+    async def _post_command(
+        self,
+        command: str,
+        endpoint: tuple[str, str, str],
+        *,
+        body: bytes,
+        query: str,
+        accepted_codes: frozenset[str],
+        suppress_errors: bool,
+    ) -> bool | None:
+        """Post one command to one endpoint.
+
+        Returns None on transient failures that warrant trying another endpoint.
+        """
+        url = endpoint[2] + query
 
-            if response.status != 200:
-                if response.status >= 500 or response.status == 429:
-                    LOGGER.debug(
-                        "Signaling command %s transient error (%s) on %s",
-                        command,
-                        response.status,
-                        url,
-                    )
-                    continue
-
-                if not suppress_errors:
-                    LOGGER.warning(
-                        "Signaling command %s failed (%s) on %s: %s",
-                        command,
-                        response.status,
-                        url,
-                        response_text,
-                    )
-                return False
+        try:
+            async with self._session.post(
+                url,
+                data=body,
+                headers=self._headers,
+            ) as response:
+                status = response.status
+                # Transient failures are decided on the status alone, and the
+                # body of other errors is only needed for the warning log
+                if status == 200 or (
+                    not suppress_errors
+                    and status not in TRANSIENT_STATUS_CODES
+                    and status < 500
+                ):
+                    response_text = await response.text()
+                else:
+                    response_text = ""
+        except (aiohttp.ClientError, TimeoutError) as err:
+            LOGGER.debug(
+                "Signaling request failed for %s on %s: %s",
+                command,
+                url,
+                err,
+            )
+            return None
 
-            result = str(data.get("result", "")).lower()
-            code = str(data.get("code", "")).lower()
-            if result == "success" and code in accepted_codes:
-                self._preferred_domain = domain
-                self._preferred_path = path_template
-                return True
+        if status == 404:
+            return None
+
+        if status != 200:
+            if status >= 500 or status == 429:
+                LOGGER.debug(
+                    "Signaling command %s transient error (%s) on %s",
+                    command,
+                    status,
+                    url,
+                )
+                return None
 
             if not suppress_errors:
                 LOGGER.warning(
-                    "Signaling command %s rejected on %s: result=%s code=%s body=%s",
+                    "Signaling command %s failed (%s) on %s: %s",
                     command,
+                    status,
                     url,
-                    result,
-                    code,
                     response_text,
                 )
             return False
 
-        log_fn = LOGGER.debug if suppress_errors else LOGGER.warning
-        log_fn("Signaling command %s failed on all endpoints", command)
+        data: dict[str, Any] = {}
+        if response_text:
+            try:
+                data = _loads(response_text)
+            except ValueError:
+                data = {}
+
+        result = data.get("result")
+        code = data.get("code")
+        if (
+            isinstance(result, str)
+            and isinstance(code, str)
+            and result.lower() == "success"
+            and code.lower() in accepted_codes
+        ):
+            return True
+
+        if not suppress_errors:
+            LOGGER.warning(
+                "Signaling command %s rejected on %s: result=%s code=%s body=%s",
+                command,
+                url,
+                result,
+                code,
+                response_text,
+            )
         return False
 
-    def _iter_endpoints(self) -> list[tuple[str, str]]:
-        """Return endpoint candidates, preferring last known good target."""
+    def _mark_endpoint_good(self, endpoint: tuple[str, str, str]) -> None:
+        """Prefer and pin the endpoint that last accepted a command."""
+        domain, path_template, _ = endpoint
+        if self._preferred_domain != domain or self._preferred_path != path_template:
+            self._preferred_domain = domain
+            self._preferred_path = path_template
+            self._build_endpoint_urls()
+        self._pinned_endpoint = endpoint
+
+    def _encode_body(self, command: str, payload: dict[str, Any] | None) -> bytes:
+        """Serialize the peer message request body for one command."""
+        message_data: dict[str, Any] = {"cmd": command}
+        if payload is not None:
+            message_data["payload"] = payload
+
+        request_body = {
+            "destination": self._device_user_id,
+            "enable_offline_messaging": False,
+            "enable_historical_messaging": False,
+            "payload": _dumps(message_data).decode(),
+        }
+        return _dumps(request_body)
+
+    def _build_headers(self) -> None:
+        """Build request headers for the current token."""
+        self._headers = {
+            "Content-Type": "application/json",
+            "x-agora-token": self._token,
+            "x-agora-uid": self._app_user_id,
+            "Authorization": f"agora token={self._token}",
+        }
+
+    def _iter_endpoints(self) -> Iterator[tuple[str, str, str]]:
+        """Yield the pinned endpoint, falling back to all candidates if it fails."""
+        pinned = self._pinned_endpoint
+        if pinned is not None:
+            yield pinned
+            # Only resumed when the pinned endpoint failed transiently
+            self._pinned_endpoint = None
+        for endpoint in self._endpoint_urls:
+            if endpoint != pinned:
+                yield endpoint
+
+    def _hedge_endpoints(self) -> tuple[tuple[str, str, str], ...]:
+        """Return the preferred endpoint of every signaling domain."""
+        seen: set[str] = set()
+        endpoints = []
+        for endpoint in self._endpoint_urls:
+            if endpoint[0] not in seen:
+                seen.add(endpoint[0])
+                endpoints.append(endpoint)
+        return tuple(endpoints)
+
+    def _build_endpoint_urls(self) -> None:
+        """Precompute endpoint URLs, preferring last known good target."""
+        if not self._app_user_id:
+            self._endpoint_urls = ()
+            return
+
         domains = [*SIGNALING_DOMAINS]
         if self._preferred_domain in domains:
             domains.remove(self._preferred_domain)
@@ -293,7 +525,16 @@ class AgoraRTMSignaling:
             paths.remove(self._preferred_path)
             paths.insert(0, self._preferred_path)
 
-        return [(domain, path) for domain in domains for path in paths]
+        encoded_user_id = quote(self._app_user_id, safe="")
+        resolved_paths = [
+            (path, path.format(app_id=self._app_id, user_id=encoded_user_id))
+            for path in paths
+        ]
+        self._endpoint_urls = tuple(
+            (domain, path, f"https://{domain}{resolved_path}")
+            for domain in domains
+            for path, resolved_path in resolved_paths
+        )
 
     def _ensure_heartbeat_locked(self) -> None:
         """Start heartbeat task if not already running."""
@@ -302,54 +543,83 @@ class AgoraRTMSignaling:
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
     async def _heartbeat_loop(self) -> None:
-        """Send live_heartbeat every 500ms while streaming."""
+        """Send live_heartbeat every 500ms while streaming.
+
+        Requests run in the background so slow responses do not shift the
+        cadence; a tick is skipped while the previous heartbeat is in flight.
+        """
         consecutive_failures = 0
+        in_flight: asyncio.Task[bool] | None = None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
         try:
             while True:
-                await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
-                sent = await self._send_command(
-                    command="live_heartbeat",
-                    payload={"isSD": self._is_sd},
-                    wait_for_ack=False,
-                    accepted_codes=SUCCESS_CODES,
-                    suppress_errors=True,
-                )
-                if sent:
-                    consecutive_failures = 0
-                    continue
-
-                consecutive_failures += 1
-                if consecutive_failures >= HEARTBEAT_MAX_FAILURES:
-                    LOGGER.warning(
-                        "Signaling heartbeat failed %d consecutive times; stopping heartbeat",
-                        consecutive_failures,
+                deadline += HEARTBEAT_INTERVAL_SECONDS
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                elif -delay > HEARTBEAT_INTERVAL_SECONDS:
+                    # Skip missed ticks instead of sending a burst of heartbeats
+                    deadline = loop.time()
+
+                if in_flight is not None:
+                    if not in_flight.done():
+                        continue
+                    if in_flight.result():
+                        consecutive_failures = 0
+                    else:
+                        consecutive_failures += 1
+                        if consecutive_failures >= HEARTBEAT_MAX_FAILURES:
+                            LOGGER.warning(
+                                "Signaling heartbeat failed %d consecutive times; stopping heartbeat",
+                                consecutive_failures,
+                            )
+                            return
+
+                in_flight = asyncio.create_task(
+                    self._send_command(
+                        command="live_heartbeat",
+                        wait_for_ack=False,
+                        accepted_codes=SUCCESS_CODES,
+                        suppress_errors=True,
                     )
-                    return
+                )
         except asyncio.CancelledError:
             LOGGER.debug("Signaling heartbeat loop cancelled")
+        finally:
+            if in_flight is not None and not in_flight.done():
+                in_flight.cancel()
 
     async def _teardown_locked(self, send_stop: bool) -> None:
-        """Stop heartbeat and release Signaling session."""
+        """Stop heartbeat and clear Signaling credentials."""
         heartbeat_task = self._heartbeat_task
         self._heartbeat_task = None
         if heartbeat_task and not heartbeat_task.done():
             heartbeat_task.cancel()
-            await asyncio.gather(heartbeat_task, return_exceptions=True)
+            try:
+                await heartbeat_task
+            except asyncio.CancelledError:
+                # Only the heartbeat's own cancellation is expected here
+                current_task = asyncio.current_task()
+                if current_task is not None and current_task.cancelling():
+                    raise
+            except Exception as err:  # noqa: BLE001
+                LOGGER.debug("Signaling heartbeat ended with error: %s", err)
 
         if send_stop:
             await self._send_command(
                 command="stop_live",
-                payload=None,
                 wait_for_ack=False,
                 accepted_codes=STOP_SUCCESS_CODES,
                 suppress_errors=True,
             )
 
-        if self._session and not self._session.closed:
-            await self._session.close()
-        self._session = None
         self._app_user_id = None
         self._device_user_id = None
         self._token = None
         self._preferred_domain = None
         self._preferred_path = None
+        self._endpoint_urls = ()
+        self._pinned_endpoint = None
+        self._cached_bodies = {}
+        self._headers = {}
@@ -2,138 +2,244 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+import re
 from typing import Any
 
+_FINGERPRINT_RE = re.compile(r"(\S+)\s+(\S+)", re.ASCII)
+_RTPMAP_RE = re.compile(r"(\d+)\s+([^/\s]+)(?:/(\d+)(?:/(\S+))?)?", re.ASCII)
+_FMTP_RE = re.compile(r"(\d+)(?:\s+(.*))?", re.ASCII)
+_RTCP_FB_RE = re.compile(r"(\d+)(?:\s+(\S+))?(?:\s+(.+?))?\s*", re.ASCII)
+_EXTMAP_RE = re.compile(r"(\d+)(?:/\S+)?\s+(\S+)", re.ASCII)
+_FMTP_PARAM_RE = re.compile(r"\s*([^=;]+?)\s*=\s*([^;]*?)\s*(?:;|$)")
+_DIRECTIONS = frozenset({"sendrecv", "sendonly", "recvonly", "inactive"})
+
+
+class _ParseState:
+    """Mutable state shared by the SDP line handlers."""
+
+    __slots__ = ("current_media", "parsed")
+
+    def __init__(self) -> None:
+        self.parsed: dict[str, Any] = {"media": []}
+        self.current_media: dict[str, Any] | None = None
+
+
+def _parse_version(state: _ParseState, value: str) -> None:
+    state.parsed["version"] = value
+
+
+def _parse_origin(state: _ParseState, value: str) -> None:
+    values = value.split()
+    if len(values) >= 6:
+        state.parsed["origin"] = {
+            "username": values[0],
+            "sessionId": values[1],
+            "sessionVersion": values[2],
+            "netType": values[3],
+            "ipVer": values[4],
+            "address": values[5],
+        }
+
+
+def _parse_name(state: _ParseState, value: str) -> None:
+    state.parsed["name"] = value
+
+
+def _parse_media(state: _ParseState, value: str) -> None:
+    values = value.split()
+    state.current_media = {
+        "type": values[0],
+        "port": int(values[1]),
+        "protocol": values[2],
+        "payloads": " ".join(values[3:]),
+        "rtp": [],
+        # fmtp and rtcp-fb entries are grouped by payload type
+        "fmtp": {},
+        "rtcpFb": {},
+        "ext": [],
+        "fingerprints": [],
+        "attributes": {},
+    }
+    state.parsed["media"].append(state.current_media)
+
+
+def _parse_ice_ufrag(
+    state: _ParseState, target: dict[str, Any], value: str | None
+) -> None:
+    target["iceUfrag"] = value
+
+
+def _parse_ice_pwd(
+    state: _ParseState, target: dict[str, Any], value: str | None
+) -> None:
+    target["icePwd"] = value
+
+
+def _parse_fingerprint(
+    state: _ParseState, target: dict[str, Any], value: str | None
+) -> None:
+    if not value or (match := _FINGERPRINT_RE.match(value)) is None:
+        return
+    fingerprint = {
+        "hash": match[1],
+        "fingerprint": match[2],
+    }
+    target.setdefault("fingerprints", []).append(fingerprint)
+    target["fingerprint"] = fingerprint
+
+
+def _parse_setup(state: _ParseState, target: dict[str, Any], value: str | None) -> None:
+    target["setup"] = value
+
+
+def _parse_mid(state: _ParseState, target: dict[str, Any], value: str | None) -> None:
+    target["mid"] = value
+
+
+def _parse_ice_options(
+    state: _ParseState, target: dict[str, Any], value: str | None
+) -> None:
+    target["iceOptions"] = value
+
+
+def _parse_rtpmap(
+    state: _ParseState, target: dict[str, Any], value: str | None
+) -> None:
+    if not value or (match := _RTPMAP_RE.match(value)) is None:
+        return
+    payload, codec, rate, encoding = match.groups()
+    target["rtp"].append(
+        {
+            "payload": int(payload),
+            "codec": codec,
+            "rate": int(rate) if rate else 90000,
+            "encoding": encoding,
+        }
+    )
+
+
+def _parse_fmtp(state: _ParseState, target: dict[str, Any], value: str | None) -> None:
+    if not value or (match := _FMTP_RE.match(value)) is None:
+        return
+    payload = int(match[1])
+    target["fmtp"].setdefault(payload, []).append(
+        {
+            "payload": payload,
+            "config": match[2] or "",
+        }
+    )
+
+
+def _parse_rtcp_fb(
+    state: _ParseState, target: dict[str, Any], value: str | None
+) -> None:
+    if not value or (match := _RTCP_FB_RE.fullmatch(value)) is None:
+        return
+    payload = int(match[1])
+    target["rtcpFb"].setdefault(payload, []).append(
+        {
+            "payload": payload,
+            "type": match[2] or "",
+            "subtype": match[3],
+        }
+    )
+
+
+def _parse_extmap(
+    state: _ParseState, target: dict[str, Any], value: str | None
+) -> None:
+    if not value or (match := _EXTMAP_RE.match(value)) is None:
+        return
+    target["ext"].append(
+        {
+            "value": int(match[1]),
+            "uri": match[2],
+        }
+    )
+
+
+def _parse_group(state: _ParseState, target: dict[str, Any], value: str | None) -> None:
+    if not value:
+        return
+    values = value.split()
+    state.parsed.setdefault("groups", []).append(
+        {
+            "type": values[0],
+            "mids": " ".join(values[1:]),
+        }
+    )
+
+
+def _parse_msid_semantic(
+    state: _ParseState, target: dict[str, Any], value: str | None
+) -> None:
+    if not value:
+        return
+    values = value.split()
+    state.parsed["msidSemantic"] = {
+        "semantic": values[0],
+        "token": values[1] if len(values) > 1 else "",
+    }
+
+
+_ATTRIBUTE_HANDLERS: dict[
+    str, Callable[[_ParseState, dict[str, Any], str | None], None]
+] = {
+    "ice-ufrag": _parse_ice_ufrag,
+    "ice-pwd": _parse_ice_pwd,
+    "fingerprint": _parse_fingerprint,
+    "setup": _parse_setup,
+    "mid": _parse_mid,
+    "ice-options": _parse_ice_options,
+    "rtpmap": _parse_rtpmap,
+    "fmtp": _parse_fmtp,
+    "rtcp-fb": _parse_rtcp_fb,
+    "extmap": _parse_extmap,
+    "group": _parse_group,
+    "msid-semantic": _parse_msid_semantic,
+}
+
+
+def _parse_attribute(state: _ParseState, value: str) -> None:
+    attribute, separator, attribute_value = value.partition(":")
+    target = state.current_media if state.current_media is not None else state.parsed
+
+    if attribute in _DIRECTIONS:
+        target["direction"] = attribute
+        return
+
+    handler = _ATTRIBUTE_HANDLERS.get(attribute)
+    if handler is not None:
+        handler(state, target, attribute_value if separator else None)
+
+
+_LINE_HANDLERS: dict[str, Callable[[_ParseState, str], None]] = {
+    "v": _parse_version,
+    "o": _parse_origin,
+    "s": _parse_name,
+    "m": _parse_media,
+    "a": _parse_attribute,
+}
+
 
 class SDPParser:
     """Small SDP parser used to build ORTC capabilities for join_v3."""
 
     @staticmethod
     def parse(sdp: str) -> dict[str, Any]:
-        parsed: dict[str, Any] = {"media": []}
-        current_media: dict[str, Any] | None = None
+        state = _ParseState()
+        line_handlers = _LINE_HANDLERS
 
-        for raw_line in sdp.splitlines():
-            line = raw_line.strip()
-            if not line:
+        for line in sdp.strip().splitlines():
+            line_type, separator, line_value = line.partition("=")
+            if not separator:
                 continue
+            handler = line_handlers.get(line_type)
+            if handler is not None:
+                handler(state, line_value)
 
-            parts = line.split("=", 1)
-            if len(parts) != 2:
-                continue
-            line_type, line_value = parts
-
-            if line_type == "v":
-                parsed["version"] = line_value
-            elif line_type == "o":
-                values = line_value.split()
-                if len(values) >= 6:
-                    parsed["origin"] = {
-                        "username": values[0],
-                        "sessionId": values[1],
-                        "sessionVersion": values[2],
-                        "netType": values[3],
-                        "ipVer": values[4],
-                        "address": values[5],
-                    }
-            elif line_type == "s":
-                parsed["name"] = line_value
-            elif line_type == "m":
-                values = line_value.split()
-                current_media = {
-                    "type": values[0],
-                    "port": int(values[1]),
-                    "protocol": values[2],
-                    "payloads": " ".join(values[3:]),
-                    "rtp": [],
-                    "fmtp": [],
-                    "rtcpFb": [],
-                    "ext": [],
-                    "fingerprints": [],
-                    "attributes": {},
-                }
-                parsed["media"].append(current_media)
-            elif line_type == "a":
-                attribute_parts = line_value.split(":", 1)
-                attribute = attribute_parts[0]
-                value = attribute_parts[1] if len(attribute_parts) > 1 else None
-
-                target = current_media if current_media is not None else parsed
-
-                if attribute == "ice-ufrag":
-                    target["iceUfrag"] = value
-                elif attribute == "ice-pwd":
-                    target["icePwd"] = value
-                elif attribute == "fingerprint" and value:
-                    values = value.split()
-                    if len(values) >= 2:
-                        fingerprint = {
-                            "hash": values[0],
-                            "fingerprint": values[1],
-                        }
-                        target.setdefault("fingerprints", []).append(fingerprint)
-                        target["fingerprint"] = fingerprint
-                elif attribute == "setup":
-                    target["setup"] = value
-                elif attribute == "mid":
-                    target["mid"] = value
-                elif attribute in {"sendrecv", "sendonly", "recvonly", "inactive"}:
-                    target["direction"] = attribute
-                elif attribute == "ice-options":
-                    target["iceOptions"] = value
-                elif attribute == "rtpmap" and value:
-                    values = value.split(None, 1)
-                    payload = int(values[0])
-                    rtp_map = values[1].split("/")
-                    target["rtp"].append(
-                        {
-                            "payload": payload,
-                            "codec": rtp_map[0],
-                            "rate": int(rtp_map[1]) if len(rtp_map) > 1 else 90000,
-                            "encoding": rtp_map[2] if len(rtp_map) > 2 else None,
-                        }
-                    )
-                elif attribute == "fmtp" and value:
-                    values = value.split(None, 1)
-                    target["fmtp"].append(
-                        {
-                            "payload": int(values[0]),
-                            "config": values[1] if len(values) > 1 else "",
-                        }
-                    )
-                elif attribute == "rtcp-fb" and value:
-                    values = value.split()
-                    target["rtcpFb"].append(
-                        {
-                            "payload": int(values[0]),
-                            "type": values[1] if len(values) > 1 else "",
-                            "subtype": " ".join(values[2:]) if len(values) > 2 else None,
-                        }
-                    )
-                elif attribute == "extmap" and value:
-                    values = value.split()
-                    if len(values) >= 2:
-                        target["ext"].append(
-                            {
-                                "value": int(values[0]),
-                                "uri": values[1],
-                            }
-                        )
-                elif attribute == "group" and value:
-                    parsed.setdefault("groups", []).append(
-                        {
-                            "type": value.split()[0],
-                            "mids": " ".join(value.split()[1:]),
-                        }
-                    )
-                elif attribute == "msid-semantic" and value:
-                    values = value.split()
-                    parsed["msidSemantic"] = {
-                        "semantic": values[0],
-                        "token": values[1] if len(values) > 1 else "",
-                    }
-
-        return parsed
+        return state.parsed
 
 
 def parse_offer_to_ortc(offer_sdp: str) -> dict[str, Any]:
@@ -195,9 +301,11 @@ def parse_offer_to_ortc(offer_sdp: str) -> dict[str, Any]:
     for media in parsed.get("media", []):
         media_type = media.get("type")
         direction = media.get("direction", "sendrecv")
+        feedbacks = media["rtcpFb"]
+        fmtps = media["fmtp"]
 
         codecs = []
-        for rtp in media.get("rtp", []):
+        for rtp in media["rtp"]:
             payload_type = rtp.get("payload")
             codec = {
                 "payloadType": payload_type,
@@ -210,23 +318,18 @@ def parse_offer_to_ortc(offer_sdp: str) -> dict[str, Any]:
                 "fmtp": {"parameters": {}},
             }
 
-            for feedback in media.get("rtcpFb", []):
-                if feedback.get("payload") == payload_type:
-                    codec["rtcpFeedbacks"].append(
-                        {
-                            "type": feedback.get("type"),
-                            "parameter": feedback.get("subtype"),
-                        }
-                    )
-
-            for fmtp in media.get("fmtp", []):
-                if fmtp.get("payload") != payload_type:
-                    continue
-                for part in str(fmtp.get("config", "")).split(";"):
-                    if "=" not in part:
-                        continue
-                    key, value = part.split("=", 1)
-                    codec["fmtp"]["parameters"][key.strip()] = value.strip()
+            for feedback in feedbacks.get(payload_type, ()):
+                codec["rtcpFeedbacks"].append(
+                    {
+                        "type": feedback.get("type"),
+                        "parameter": feedback.get("subtype"),
+                    }
+                )
+
+            for fmtp in fmtps.get(payload_type, ()):
+                codec["fmtp"]["parameters"].update(
+                    _FMTP_PARAM_RE.findall(fmtp["config"])
+                )
 
             codecs.append(codec)
 
@@ -235,7 +338,7 @@ def parse_offer_to_ortc(offer_sdp: str) -> dict[str, Any]:
                 "entry": extension.get("value"),
                 "extensionName": extension.get("uri"),
             }
-            for extension in media.get("ext", [])
+            for extension in media["ext"]
         ]
 
         if direction == "sendonly":
@@ -8,13 +8,12 @@ import logging
 import secrets
 import ssl
 import time
-from collections import defaultdict
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from pypetkitapi import LiveFeed
-from sdp_transform import parse as sdp_parse
 from webrtc_models import RTCIceCandidateInit
 from websockets.asyncio.client import ClientConnection, connect
 from websockets.exceptions import WebSocketException
@@ -22,8 +21,24 @@ from websockets.exceptions import WebSocketException
 from .agora_api import AgoraResponse, RESPONSE_FLAGS
 from .agora_sdp import parse_offer_to_ortc
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
+if orjson is not None:
+
+    def _dumps(obj: Any) -> str:
+        # Agora expects text frames, so keep sending str rather than bytes
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
 
 def _create_ws_ssl_context() -> ssl.SSLContext:
     """Create permissive SSL context for Agora edge WebSocket."""
@@ -35,11 +50,56 @@ def _create_ws_ssl_context() -> ssl.SSLContext:
 
 _SSL_CONTEXT = _create_ws_ssl_context()
 
+_DIRECTIONS = frozenset({"sendrecv", "sendonly", "recvonly", "inactive"})
+_ENCRYPTED_EXTMAP_URI = "urn:ietf:params:rtp-hdrext:encrypt"
+# Message ids are plain hex, so the ping frame needs no JSON escaping
+_PING_FRAME = '{"_id":"%s","_type":"ping"}'
+# Bit per mandatory SDP line type checked by _validate_sdp (m= needs at least one)
+_SDP_LINE_FLAGS = {"v=": 1, "o=": 2, "s=": 4, "t=": 8, "m=": 16}
+_SDP_REQUIRED_FLAGS = 31
+# Answer direction for each offer direction; anything else is inactive
+_ANSWER_DIRECTION = {
+    "sendonly": "recvonly",
+    "recvonly": "sendonly",
+    "sendrecv": "sendrecv",
+}
+
+# Constant parts of the join_v3 payload; shared between calls and never mutated
+_BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/142.0.0.0 Safari/537.36"
+)
+_JOIN_FEATURES: dict[str, Any] = {"rejoin": True}
+_JOIN_ATTRIBUTES: dict[str, Any] = {
+    "userAttributes": {
+        "enableAudioMetadata": False,
+        "enableAudioPts": False,
+        "enablePublishedUserList": True,
+        "maxSubscription": 50,
+        "enableUserLicenseCheck": True,
+        "enableRTX": True,
+        "enableInstantVideo": False,
+        "enableDataStream2": False,
+        "enableAutFeedback": True,
+        "enableUserAutoRebalanceCheck": True,
+        "enableXR": True,
+        "enableLossbasedBwe": True,
+        "enableAutCC": True,
+        "enablePreallocPC": False,
+        "enablePubTWCC": False,
+        "enableSubTWCC": True,
+        "enablePubRTX": True,
+        "enableSubRTX": True,
+    }
+}
+
 
 @dataclass
 class OfferSdpInfo:
     """Selected pieces of the browser offer SDP used for answer generation."""
 
+    # Only media type/payloads/direction/mid and session groups are kept
     parsed_sdp: dict[str, Any]
     fingerprint: str
     ice_ufrag: str
@@ -52,6 +112,27 @@ class OfferSdpInfo:
     setup_role: str
 
 
+def _parse_offer_extmap(value: str) -> dict[str, Any] | None:
+    """Return the header extension described by an offer a=extmap value."""
+    values = value.split()
+    entry = values[0].partition("/")[0] if values else ""
+    if not entry.isdecimal() or len(values) < 2:
+        return None
+    uri = values[1]
+    if uri == _ENCRYPTED_EXTMAP_URI and len(values) > 2:
+        uri = values[2]
+    return {"entry": int(entry), "extensionName": uri}
+
+
+def _format_fmtp_parameters(items: tuple[tuple[str, Any], ...]) -> str:
+    """Format codec fmtp parameters as an SDP parameter string."""
+    return ";".join(f"{key}={value}" for key, value in items)
+
+
+# Agora answers with the same few codec parameter sets on every negotiation
+_cached_fmtp_parameters = lru_cache(maxsize=64)(_format_fmtp_parameters)
+
+
 class AgoraWebSocketHandler:
     """WebSocket handler for Agora join_v3 signaling."""
 
@@ -62,7 +143,10 @@ class AgoraWebSocketHandler:
         """Initialize runtime state."""
         self._websocket: ClientConnection | None = None
         self._connection_state = "DISCONNECTED"
-        self._message_handlers: dict[str, Callable[[dict[str, Any]], Any]] = {}
+        self._message_handlers: dict[
+            str, Callable[[dict[str, Any]], Awaitable[Any]]
+        ] = {}
+        self._sync_handlers: dict[str, Callable[[dict[str, Any]], None]] = {}
 
         self.candidates: list[RTCIceCandidateInit] = []
         self._online_users: set[int] = set()
@@ -70,25 +154,45 @@ class AgoraWebSocketHandler:
 
         self._message_loop_task: asyncio.Task[None] | None = None
         self._ping_task: asyncio.Task[None] | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+        self._send_queue: asyncio.Queue[str] | None = None
+        self._last_gateway: tuple[str, int] | None = None
 
         self._joined = False
         self._answer_sdp: str | None = None
         self._rtc_token: str | None = None
         self._rtc_token_provider = rtc_token_provider
 
+        # Message ids only need to be unique within the session
+        self._id_prefix = secrets.token_hex(2)
+        self._id_counter = 0
+
         self._setup_message_handlers()
 
     def _setup_message_handlers(self) -> None:
-        """Register incoming message handlers."""
+        """Register incoming message handlers.
+
+        Handlers that do not await anything are plain functions and are
+        dispatched without creating a coroutine.
+        """
         self._message_handlers = {
             "answer": self._handle_answer,
+            "on_token_privilege_will_expire": self._handle_token_will_expire,
+        }
+        self._sync_handlers = {
+            "on_add_video_stream": self._handle_add_video_stream,
             "on_p2p_lost": self._handle_p2p_lost,
             "error": self._handle_error,
             "on_rtp_capability_change": self._handle_rtp_capability_change,
             "on_user_online": self._handle_user_online,
-            "on_add_video_stream": self._handle_add_video_stream,
+            "on_token_privilege_did_expire": self._handle_token_did_expire,
         }
 
+    def _next_id(self) -> str:
+        """Return a new outgoing message id."""
+        self._id_counter += 1
+        return f"{self._id_prefix}{self._id_counter:04x}"
+
     def add_ice_candidate(self, candidate: RTCIceCandidateInit) -> None:
         """Collect browser ICE candidates before join_v3."""
         self.candidates.append(candidate)
@@ -124,6 +228,14 @@ class AgoraWebSocketHandler:
             LOGGER.warning("No gateway addresses in flag 4096; using fallback addresses")
             gateway_addresses = agora_response.addresses
 
+        last_gateway = self._last_gateway
+        if last_gateway is not None:
+            # Stable sort: the edge that negotiated last time goes first
+            gateway_addresses = sorted(
+                gateway_addresses,
+                key=lambda gateway: (gateway.ip, gateway.port) != last_gateway,
+            )
+
         for gateway in gateway_addresses:
             edge_ip_dashed = gateway.ip.replace(".", "-")
             ws_url = f"wss://{edge_ip_dashed}.edge.agora.io:{gateway.port}"
@@ -139,6 +251,10 @@ class AgoraWebSocketHandler:
 
                 self._websocket = websocket
                 self._connection_state = "CONNECTED"
+                self._send_queue = asyncio.Queue()
+                self._writer_task = asyncio.create_task(
+                    self._writer_loop(websocket, self._send_queue)
+                )
                 LOGGER.info("Connected to Agora WebSocket: %s", ws_url)
 
                 join_message = self._create_join_message(
@@ -148,7 +264,7 @@ class AgoraWebSocketHandler:
                     ortc_info=ortc_info,
                     agora_response=agora_response,
                 )
-                await websocket.send(json.dumps(join_message))
+                await websocket.send(_dumps(join_message))
                 LOGGER.debug("Sent join_v3 message")
 
                 answer_sdp = await self._wait_for_join_response(
@@ -158,14 +274,14 @@ class AgoraWebSocketHandler:
                 )
 
                 if answer_sdp:
+                    self._last_gateway = (gateway.ip, gateway.port)
                     self._message_loop_task = asyncio.create_task(
                         self._message_loop(websocket)
                     )
                     self._ping_task = asyncio.create_task(self._ping_loop())
                     return answer_sdp
 
-                await websocket.close()
-                self._websocket = None
+                await self.disconnect()
 
             except asyncio.TimeoutError:
                 LOGGER.warning("WebSocket connection timeout for %s", ws_url)
@@ -191,13 +307,16 @@ class AgoraWebSocketHandler:
             async with asyncio.timeout(15):
                 async for raw_message in websocket:
                     try:
-                        response = json.loads(raw_message)
+                        response = _loads(raw_message)
                     except json.JSONDecodeError:
                         LOGGER.debug("Dropped non-JSON websocket payload")
                         continue
 
                     message_type = response.get("_type", "")
-                    if message_type in self._message_handlers:
+                    sync_handler = self._sync_handlers.get(message_type)
+                    if sync_handler is not None:
+                        sync_handler(response)
+                    elif message_type in self._message_handlers:
                         result = await self._message_handlers[message_type](response)
                         if isinstance(result, str) and result:
                             return result
@@ -225,21 +344,18 @@ class AgoraWebSocketHandler:
         try:
             async for raw_message in websocket:
                 try:
-                    response = json.loads(raw_message)
+                    response = _loads(raw_message)
                 except json.JSONDecodeError:
                     continue
 
                 message_type = response.get("_type", "")
 
-                if message_type in self._message_handlers:
+                sync_handler = self._sync_handlers.get(message_type)
+                if sync_handler is not None:
+                    sync_handler(response)
+                elif message_type in self._message_handlers:
                     await self._message_handlers[message_type](response)
 
-                if message_type == "on_token_privilege_will_expire":
-                    LOGGER.warning("Agora token expiring soon, sending renew_token")
-                    await self._send_renew_token()
-                elif message_type == "on_token_privilege_did_expire":
-                    LOGGER.error("Agora token expired")
-
         except asyncio.CancelledError:
             LOGGER.debug("Agora message loop cancelled")
         except WebSocketException as err:
@@ -254,15 +370,29 @@ class AgoraWebSocketHandler:
                 await asyncio.sleep(3)
                 if not self._websocket:
                     break
-                ping_message = {
-                    "_id": secrets.token_hex(3),
-                    "_type": "ping",
-                }
-                await self._websocket.send(json.dumps(ping_message))
+                if self._send_queue is not None:
+                    self._send_queue.put_nowait(_PING_FRAME % self._next_id())
         except asyncio.CancelledError:
             LOGGER.debug("Agora ping loop cancelled")
+
+    async def _writer_loop(
+        self, websocket: ClientConnection, queue: asyncio.Queue[str]
+    ) -> None:
+        """Write queued frames, draining whatever was queued in the same tick."""
+        try:
+            while True:
+                await websocket.send(await queue.get())
+                while not queue.empty():
+                    await websocket.send(queue.get_nowait())
+        except asyncio.CancelledError:
+            LOGGER.debug("Agora writer loop cancelled")
         except (WebSocketException, OSError) as err:
-            LOGGER.debug("Agora ping loop ended: %s", err)
+            LOGGER.debug("Agora writer loop ended: %s", err)
+
+    def _queue_frame(self, message: dict[str, Any]) -> None:
+        """Serialize one outgoing message and hand it to the writer loop."""
+        if self._send_queue is not None:
+            self._send_queue.put_nowait(_dumps(message))
 
     async def _send_renew_token(self) -> None:
         """Send renew_token with current rtc token."""
@@ -281,11 +411,11 @@ class AgoraWebSocketHandler:
             return
 
         renew_message = {
-            "_id": secrets.token_hex(3),
+            "_id": self._next_id(),
             "_type": "renew_token",
             "_message": {"token": self._rtc_token},
         }
-        await self._websocket.send(json.dumps(renew_message))
+        self._queue_frame(renew_message)
 
     async def _handle_join_success(
         self,
@@ -300,17 +430,19 @@ class AgoraWebSocketHandler:
             LOGGER.error("join_v3 success did not include ORTC parameters")
             return None
 
-        await self._send_set_client_role(role="host", level=0)
+        self._send_set_client_role(role="host", level=0)
 
         # Inject auth fingerprints if not present in ORTC payload.
         dtls_parameters = ortc.setdefault("dtlsParameters", {})
         fingerprints = dtls_parameters.setdefault("fingerprints", [])
 
-        seen = {
-            str(item.get("fingerprint", "")).lower()
-            for item in fingerprints
-            if item.get("fingerprint")
-        }
+        seen: set[str] = set()
+        if fingerprints:
+            seen.update(
+                str(fingerprint).lower()
+                for item in fingerprints
+                if (fingerprint := item.get("fingerprint"))
+            )
 
         gateway_addresses = agora_response.get_gateway_addresses() or agora_response.addresses
         for address in gateway_addresses:
@@ -325,7 +457,8 @@ class AgoraWebSocketHandler:
                     fingerprint_algorithm = parts[0]
                     fingerprint_value = parts[1]
 
-            if fingerprint_value.lower() in seen:
+            lowered = fingerprint_value.lower()
+            if lowered in seen:
                 continue
 
             fingerprints.append(
@@ -334,7 +467,7 @@ class AgoraWebSocketHandler:
                     "fingerprint": fingerprint_value,
                 }
             )
-            seen.add(fingerprint_value.lower())
+            seen.add(lowered)
 
         answer_sdp = self._generate_answer_sdp(ortc, offer_info)
         if answer_sdp:
@@ -352,7 +485,7 @@ class AgoraWebSocketHandler:
             return answer_sdp
         return None
 
-    async def _handle_p2p_lost(self, response: dict[str, Any]) -> None:
+    def _handle_p2p_lost(self, response: dict[str, Any]) -> None:
         """Handle p2p_lost signaling."""
         LOGGER.warning(
             "Agora p2p_lost: code=%s error=%s",
@@ -361,23 +494,35 @@ class AgoraWebSocketHandler:
         )
         asyncio.create_task(self.disconnect())
 
-    async def _handle_error(self, response: dict[str, Any]) -> None:
+    def _handle_error(self, response: dict[str, Any]) -> None:
         """Handle generic Agora signaling errors."""
         message = response.get("_message", {})
         LOGGER.error("Agora error message: %s", message.get("error", message))
 
-    async def _handle_rtp_capability_change(self, response: dict[str, Any]) -> None:
+    def _handle_rtp_capability_change(self, response: dict[str, Any]) -> None:
         """Handle capability updates."""
-        LOGGER.debug("Agora rtp capability change: %s", response.get("_message", {}))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Agora rtp capability change: %s", response.get("_message", {})
+            )
+
+    async def _handle_token_will_expire(self, response: dict[str, Any]) -> None:
+        """Renew the RTC token before Agora drops the session."""
+        LOGGER.warning("Agora token expiring soon, sending renew_token")
+        await self._send_renew_token()
 
-    async def _handle_user_online(self, response: dict[str, Any]) -> None:
+    def _handle_token_did_expire(self, response: dict[str, Any]) -> None:
+        """Report an expired RTC token."""
+        LOGGER.error("Agora token expired")
+
+    def _handle_user_online(self, response: dict[str, Any]) -> None:
         """Track online users."""
         message = response.get("_message", {})
         uid = message.get("uid")
         if isinstance(uid, int):
             self._online_users.add(uid)
 
-    async def _handle_add_video_stream(self, response: dict[str, Any]) -> None:
+    def _handle_add_video_stream(self, response: dict[str, Any]) -> None:
         """Auto-subscribe to newly announced video stream."""
         message = response.get("_message", {})
         uid = message.get("uid")
@@ -396,15 +541,15 @@ class AgoraWebSocketHandler:
         }
 
         if self._websocket and isinstance(ssrc_id, int):
-            await self._send_subscribe(stream_id=uid, ssrc_id=ssrc_id, codec="h264")
+            self._send_subscribe(stream_id=uid, ssrc_id=ssrc_id, codec="h264")
 
-    async def _send_set_client_role(self, role: str = "audience", level: int = 1) -> None:
+    def _send_set_client_role(self, role: str = "audience", level: int = 1) -> None:
         """Send set_client_role signaling message."""
         if not self._websocket:
             return
 
         message = {
-            "_id": secrets.token_hex(3),
+            "_id": self._next_id(),
             "_type": "set_client_role",
             "_message": {
                 "role": role,
@@ -412,9 +557,9 @@ class AgoraWebSocketHandler:
                 "client_ts": int(time.time() * 1000),
             },
         }
-        await self._websocket.send(json.dumps(message))
+        self._queue_frame(message)
 
-    async def _send_subscribe(
+    def _send_subscribe(
         self,
         stream_id: int,
         ssrc_id: int,
@@ -431,7 +576,7 @@ class AgoraWebSocketHandler:
             return
 
         message = {
-            "_id": secrets.token_hex(3),
+            "_id": self._next_id(),
             "_type": "subscribe",
             "_message": {
                 "stream_id": stream_id,
@@ -445,7 +590,7 @@ class AgoraWebSocketHandler:
                 "ssrcId": ssrc_id,
             },
         }
-        await self._websocket.send(json.dumps(message))
+        self._queue_frame(message)
 
     def _create_join_message(
         self,
@@ -456,13 +601,14 @@ class AgoraWebSocketHandler:
         agora_response: AgoraResponse,
     ) -> dict[str, Any]:
         """Build join_v3 message payload."""
+        raw_id = secrets.token_hex(16)
         process_id = (
-            f"process-{secrets.token_hex(4)}-{secrets.token_hex(2)}-"
-            f"{secrets.token_hex(2)}-{secrets.token_hex(2)}-{secrets.token_hex(6)}"
+            f"process-{raw_id[:8]}-{raw_id[8:12]}-"
+            f"{raw_id[12:16]}-{raw_id[16:20]}-{raw_id[20:]}"
         )
 
         return {
-            "_id": secrets.token_hex(3),
+            "_id": self._next_id(),
             "_type": "join_v3",
             "_message": {
                 "p2p_id": 1,
@@ -471,11 +617,7 @@ class AgoraWebSocketHandler:
                 "channel_key": live_feed.rtc_token,
                 "channel_name": live_feed.channel_id,
                 "sdk_version": "4.24.0",
-                "browser": (
-                    "Mozilla/5.0 (X11; Linux x86_64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/142.0.0.0 Safari/537.36"
-                ),
+                "browser": _BROWSER_USER_AGENT,
                 "process_id": process_id,
                 "mode": "live",
                 "codec": "h264",
@@ -486,29 +628,8 @@ class AgoraWebSocketHandler:
                 ),
                 "extend": "",
                 "details": {},
-                "features": {"rejoin": True},
-                "attributes": {
-                    "userAttributes": {
-                        "enableAudioMetadata": False,
-                        "enableAudioPts": False,
-                        "enablePublishedUserList": True,
-                        "maxSubscription": 50,
-                        "enableUserLicenseCheck": True,
-                        "enableRTX": True,
-                        "enableInstantVideo": False,
-                        "enableDataStream2": False,
-                        "enableAutFeedback": True,
-                        "enableUserAutoRebalanceCheck": True,
-                        "enableXR": True,
-                        "enableLossbasedBwe": True,
-                        "enableAutCC": True,
-                        "enablePreallocPC": False,
-                        "enablePubTWCC": False,
-                        "enableSubTWCC": True,
-                        "enablePubRTX": True,
-                        "enableSubRTX": True,
-                    }
-                },
+                "features": _JOIN_FEATURES,
+                "attributes": _JOIN_ATTRIBUTES,
                 "join_ts": int(time.time() * 1000),
                 "ortc": ortc_info,
             },
@@ -523,22 +644,27 @@ class AgoraWebSocketHandler:
             if not candidate_string:
                 continue
 
-            if candidate_string.startswith("candidate:"):
-                candidate_string = candidate_string[10:]
-
-            parts = candidate_string.split()
-            if len(parts) < 8:
-                continue
-
             try:
+                # Only the first eight fields are used; extensions stay unsplit
+                (
+                    foundation,
+                    _component,
+                    protocol,
+                    priority,
+                    ip,
+                    port,
+                    _typ,
+                    candidate_type,
+                    *_,
+                ) = candidate_string.removeprefix("candidate:").split(None, 8)
                 converted.append(
                     {
-                        "foundation": parts[0],
-                        "ip": parts[4],
-                        "port": int(parts[5]),
-                        "priority": int(parts[3]),
-                        "protocol": parts[2],
-                        "type": parts[7],
+                        "foundation": foundation,
+                        "ip": ip,
+                        "port": int(port),
+                        "priority": int(priority),
+                        "protocol": protocol,
+                        "type": candidate_type,
                     }
                 )
             except (TypeError, ValueError):
@@ -548,77 +674,87 @@ class AgoraWebSocketHandler:
 
     @staticmethod
     def _parse_offer_sdp(offer_sdp: str) -> OfferSdpInfo | None:
-        """Parse browser SDP offer using sdp_transform."""
-        try:
-            parsed_sdp = sdp_parse(offer_sdp)
+        """Scan browser SDP offer for the fields used to build the answer."""
+        media_sections: list[dict[str, Any]] = []
+        groups: list[dict[str, Any]] = []
+        current_media: dict[str, Any] | None = None
+        media_type: str | None = None
+
+        session_values: dict[str, str] = {}
+        setup_role = ""
+        audio_extensions: list[dict[str, Any]] = []
+        video_extensions: list[dict[str, Any]] = []
+        audio_direction = "sendrecv"
+        video_direction = "sendrecv"
+        extmap_allow_mixed = False
+
+        for line in offer_sdp.splitlines():
+            if line.startswith("m="):
+                values = line[2:].split(" ", 3)
+                media_type = values[0]
+                current_media = {
+                    "type": media_type,
+                    "payloads": values[3] if len(values) > 3 else "",
+                }
+                media_sections.append(current_media)
+                continue
 
-            fingerprint = ""
-            if "fingerprint" in parsed_sdp:
-                fingerprint = parsed_sdp["fingerprint"].get("hash", "")
-            else:
-                for media in parsed_sdp.get("media", []):
-                    if "fingerprint" in media:
-                        fingerprint = media["fingerprint"].get("hash", "")
-                        break
-
-            ice_ufrag = parsed_sdp.get("iceUfrag", "")
-            ice_pwd = parsed_sdp.get("icePwd", "")
-            if not ice_ufrag or not ice_pwd:
-                for media in parsed_sdp.get("media", []):
-                    if not ice_ufrag and "iceUfrag" in media:
-                        ice_ufrag = media["iceUfrag"]
-                    if not ice_pwd and "icePwd" in media:
-                        ice_pwd = media["icePwd"]
-                    if ice_ufrag and ice_pwd:
-                        break
-
-            audio_extensions: list[dict[str, Any]] = []
-            video_extensions: list[dict[str, Any]] = []
-            audio_direction = "sendrecv"
-            video_direction = "sendrecv"
-
-            for media in parsed_sdp.get("media", []):
-                media_type = media.get("type")
-                direction = media.get("direction", "sendrecv")
+            if not line.startswith("a="):
+                continue
 
+            attribute, _, value = line[2:].partition(":")
+            if attribute in _DIRECTIONS:
+                if current_media is None:
+                    continue
+                current_media["direction"] = attribute
                 if media_type == "audio":
-                    audio_direction = direction
+                    audio_direction = attribute
                 elif media_type == "video":
-                    video_direction = direction
-
-                for extension in media.get("ext", []):
-                    entry = {
-                        "entry": extension.get("value"),
-                        "extensionName": extension.get("uri"),
-                    }
-                    if media_type == "audio":
-                        audio_extensions.append(entry)
-                    elif media_type == "video":
-                        video_extensions.append(entry)
-
-            extmap_allow_mixed = bool(parsed_sdp.get("extmapAllowMixed", False))
-
-            setup_role = "actpass"
-            for media in parsed_sdp.get("media", []):
-                if "setup" in media:
-                    setup_role = media["setup"]
-                    break
-
-            return OfferSdpInfo(
-                parsed_sdp=parsed_sdp,
-                fingerprint=fingerprint,
-                ice_ufrag=ice_ufrag,
-                ice_pwd=ice_pwd,
-                audio_extensions=audio_extensions,
-                video_extensions=video_extensions,
-                audio_direction=audio_direction,
-                video_direction=video_direction,
-                extmap_allow_mixed=extmap_allow_mixed,
-                setup_role=setup_role,
-            )
-        except (TypeError, ValueError, KeyError) as err:
-            LOGGER.error("Failed to parse offer SDP: %s", err)
-            return None
+                    video_direction = attribute
+            elif attribute == "extmap":
+                if current_media is None or media_type not in ("audio", "video"):
+                    continue
+                extension = _parse_offer_extmap(value)
+                if extension is None:
+                    continue
+                if media_type == "audio":
+                    audio_extensions.append(extension)
+                else:
+                    video_extensions.append(extension)
+            elif attribute == "mid":
+                if current_media is not None:
+                    current_media["mid"] = value
+            elif attribute in ("ice-ufrag", "ice-pwd", "fingerprint"):
+                # The first non-empty occurrence wins, session or media level
+                if not session_values.get(attribute):
+                    session_values[attribute] = value
+            elif attribute == "setup":
+                if current_media is not None and not setup_role:
+                    setup_role = value
+            elif attribute == "group":
+                group_type, _, mids = value.partition(" ")
+                groups.append({"type": group_type, "mids": mids})
+            elif attribute == "extmap-allow-mixed":
+                if current_media is None:
+                    extmap_allow_mixed = True
+
+        parsed_sdp: dict[str, Any] = {"media": media_sections}
+        if groups:
+            parsed_sdp["groups"] = groups
+        fingerprint_line = session_values.get("fingerprint", "")
+
+        return OfferSdpInfo(
+            parsed_sdp=parsed_sdp,
+            fingerprint=fingerprint_line.partition(" ")[2].strip(),
+            ice_ufrag=session_values.get("ice-ufrag", ""),
+            ice_pwd=session_values.get("ice-pwd", ""),
+            audio_extensions=audio_extensions,
+            video_extensions=video_extensions,
+            audio_direction=audio_direction,
+            video_direction=video_direction,
+            extmap_allow_mixed=extmap_allow_mixed,
+            setup_role=setup_role or "actpass",
+        )
 
     def _generate_answer_sdp(
         self,
@@ -658,7 +794,8 @@ class AgoraWebSocketHandler:
                 LOGGER.error("Missing DTLS fingerprint in Agora ORTC response")
                 return None
 
-            candidates_by_mid: dict[str, list[str]] = defaultdict(list)
+            # Agora returns one candidate set shared by every bundled section
+            candidate_lines: list[str] = []
             for index, candidate in enumerate(candidates):
                 foundation = candidate.get("foundation", f"candidate{index}")
                 protocol = candidate.get("protocol", "udp")
@@ -667,28 +804,19 @@ class AgoraWebSocketHandler:
                 port = candidate.get("port", 0)
                 candidate_type = candidate.get("type", "host")
 
-                line = (
+                generation = candidate.get("generation")
+                suffix = "" if generation is None else f" generation {generation}"
+                candidate_lines.append(
                     "a=candidate:"
-                    f"{foundation} 1 {protocol} {priority} {ip} {port} typ {candidate_type}"
+                    f"{foundation} 1 {protocol} {priority} {ip} {port} "
+                    f"typ {candidate_type}{suffix}"
                 )
-                if candidate.get("generation") is not None:
-                    line += f" generation {candidate.get('generation')}"
-                candidates_by_mid["*"].append(line)
 
             audio_codecs = caps.get("audioCodecs", []) or []
             video_codecs = caps.get("videoCodecs", []) or []
             audio_extensions = caps.get("audioExtensions", []) or []
             video_extensions = caps.get("videoExtensions", []) or []
 
-            def _answer_direction(offer_direction: str) -> str:
-                if offer_direction == "sendonly":
-                    return "recvonly"
-                if offer_direction == "recvonly":
-                    return "sendonly"
-                if offer_direction == "sendrecv":
-                    return "sendrecv"
-                return "inactive"
-
             media_sections = offer_info.parsed_sdp.get("media", []) or []
             if not media_sections:
                 return None
@@ -713,49 +841,60 @@ class AgoraWebSocketHandler:
                 sdp_lines.append("a=extmap-allow-mixed")
             sdp_lines.append("a=msid-semantic: WMS")
 
+            # Transport attributes are identical for every media section
+            transport_block = "\r\n".join(
+                (
+                    "c=IN IP4 127.0.0.1",
+                    "a=rtcp:9 IN IP4 0.0.0.0",
+                    f"a=ice-ufrag:{ice_ufrag}",
+                    f"a=ice-pwd:{ice_pwd}",
+                    "a=ice-options:trickle",
+                    f"a=fingerprint:{fingerprint}",
+                    "a=setup:active",
+                )
+            )
+
+            audio_offer_ext_map = {
+                extension.get("extensionName"): extension.get("entry")
+                for extension in offer_info.audio_extensions
+            }
+            video_offer_ext_map = {
+                extension.get("extensionName"): extension.get("entry")
+                for extension in offer_info.video_extensions
+            }
+
             for index, media in enumerate(media_sections):
                 media_type = media.get("type", "audio")
                 offer_direction = media.get("direction", "sendonly")
-                answer_direction = _answer_direction(offer_direction)
-                mid = str(media.get("mid", str(index)))
+                answer_direction = _ANSWER_DIRECTION.get(offer_direction, "inactive")
+                # Scanned mids are already strings; the index is formatted below
+                mid = media.get("mid", index)
 
                 codecs = audio_codecs if media_type == "audio" else video_codecs
                 extensions = (
                     audio_extensions if media_type == "audio" else video_extensions
                 )
 
-                payload_types = [str(codec.get("payloadType")) for codec in codecs]
-                if not payload_types:
-                    payload_types = str(media.get("payloads", "")).split()
-
-                payloads = " ".join(payload_types)
-
-                sdp_lines.extend(
-                    [
-                        f"m={media_type} 9 UDP/TLS/RTP/SAVPF {payloads}",
-                        "c=IN IP4 127.0.0.1",
-                        "a=rtcp:9 IN IP4 0.0.0.0",
-                        f"a=ice-ufrag:{ice_ufrag}",
-                        f"a=ice-pwd:{ice_pwd}",
-                        "a=ice-options:trickle",
-                        f"a=fingerprint:{fingerprint}",
-                        "a=setup:active",
-                        f"a=mid:{mid}",
-                    ]
+                if codecs:
+                    payloads = " ".join(
+                        map(str, [codec.get("payloadType") for codec in codecs])
+                    )
+                else:
+                    payloads = " ".join(media.get("payloads", "").split())
+
+                sdp_lines.append(
+                    f"m={media_type} 9 UDP/TLS/RTP/SAVPF {payloads}\r\n"
+                    f"{transport_block}\r\n"
+                    f"a=mid:{mid}"
                 )
 
-                for candidate_line in candidates_by_mid.get("*", []):
-                    sdp_lines.append(candidate_line)
+                sdp_lines.extend(candidate_lines)
 
-                offer_extensions = (
-                    offer_info.audio_extensions
+                offer_ext_map = (
+                    audio_offer_ext_map
                     if media_type == "audio"
-                    else offer_info.video_extensions
+                    else video_offer_ext_map
                 )
-                offer_ext_map = {
-                    extension.get("extensionName"): extension.get("entry")
-                    for extension in offer_extensions
-                }
 
                 for extension in extensions:
                     extension_name = extension.get("extensionName")
@@ -764,7 +903,7 @@ class AgoraWebSocketHandler:
                             f"a=extmap:{offer_ext_map[extension_name]} {extension_name}"
                         )
 
-                sdp_lines.extend([f"a={answer_direction}", "a=rtcp-mux", "a=rtcp-rsize"])
+                sdp_lines.append(f"a={answer_direction}\r\na=rtcp-mux\r\na=rtcp-rsize")
 
                 for codec in codecs:
                     payload_type = codec.get("payloadType")
@@ -799,12 +938,17 @@ class AgoraWebSocketHandler:
                     fmtp = codec.get("fmtp", {})
                     parameters = fmtp.get("parameters", {}) if fmtp else {}
                     if parameters:
-                        parameter_string = ";".join(
-                            f"{key}={value}" for key, value in parameters.items()
-                        )
+                        items = tuple(parameters.items())
+                        try:
+                            parameter_string = _cached_fmtp_parameters(items)
+                        except TypeError:  # unhashable value, format uncached
+                            parameter_string = _format_fmtp_parameters(items)
                         sdp_lines.append(f"a=fmtp:{payload_type} {parameter_string}")
 
-            answer_sdp = "\r\n".join(sdp_lines) + "\r\n"
+            # str.join sizes the result before copying; the empty tail adds the
+            # final CRLF without a second full-length concatenation
+            sdp_lines.append("")
+            answer_sdp = "\r\n".join(sdp_lines)
             if self._validate_sdp(answer_sdp):
                 return answer_sdp
             return None
@@ -818,31 +962,38 @@ class AgoraWebSocketHandler:
         if not sdp.strip():
             return False
 
-        has_version = False
-        has_origin = False
-        has_session_name = False
-        has_timing = False
-        media_count = 0
-
-        for line in sdp.split("\r\n"):
-            if line.startswith("v="):
-                has_version = True
-            elif line.startswith("o="):
-                has_origin = True
-            elif line.startswith("s="):
-                has_session_name = True
-            elif line.startswith("t="):
-                has_timing = True
-            elif line.startswith("m="):
-                media_count += 1
-
-        return has_version and has_origin and has_session_name and has_timing and media_count >= 1
+        # Walk line starts without splitting and stop once every line type is seen
+        seen = 0
+        position = 0
+        length = len(sdp)
+        while position < length:
+            flag = _SDP_LINE_FLAGS.get(sdp[position : position + 2])
+            if flag:
+                seen |= flag
+                if seen == _SDP_REQUIRED_FLAGS:
+                    return True
+            end = sdp.find("\r\n", position)
+            if end < 0:
+                break
+            position = end + 2
+
+        return False
 
     @property
     def is_connected(self) -> bool:
         """Return websocket connectivity state."""
         return self._connection_state == "CONNECTED"
 
+    @property
+    def is_active(self) -> bool:
+        """Return True while a websocket or background task needs disconnecting."""
+        return (
+            self._websocket is not None
+            or self._message_loop_task is not None
+            or self._ping_task is not None
+            or self._writer_task is not None
+        )
+
     async def disconnect(self) -> None:
         """Close websocket and cancel background tasks."""
         tasks_to_wait: list[asyncio.Task[None]] = []
@@ -854,21 +1005,27 @@ class AgoraWebSocketHandler:
                 tasks_to_wait.append(self._ping_task)
         self._ping_task = None
 
+        if self._writer_task and not self._writer_task.done():
+            self._writer_task.cancel()
+            if self._writer_task is not current_task:
+                tasks_to_wait.append(self._writer_task)
+        self._writer_task = None
+        self._send_queue = None
+
         if self._message_loop_task and not self._message_loop_task.done():
             self._message_loop_task.cancel()
             if self._message_loop_task is not current_task:
                 tasks_to_wait.append(self._message_loop_task)
         self._message_loop_task = None
 
-        if tasks_to_wait:
-            await asyncio.gather(*tasks_to_wait, return_exceptions=True)
-
+        # Cancellation and the closing handshake overlap instead of running in turn
+        pending: list[Awaitable[Any]] = [*tasks_to_wait]
         if self._websocket:
-            try:
-                await self._websocket.close()
-            except WebSocketException:
-                pass
+            pending.append(self._websocket.close())
             self._websocket = None
 
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
         self._joined = False
         self._connection_state = "DISCONNECTED"
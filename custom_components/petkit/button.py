@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from functools import cache
+import logging
 from typing import TYPE_CHECKING
 
 from pypetkitapi import (
@@ -39,6 +41,8 @@ from .const import LOGGER, POWER_ONLINE_STATE
 from .entity import PetKitDescSensorBase, PetkitEntity
 
 if TYPE_CHECKING:
+    from pypetkitapi import PetKitClient
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -58,6 +62,12 @@ class PetKitButtonDesc(PetKitDescSensorBase, ButtonEntityDescription):
 
 COMMON_ENTITIES = []
 
+# Post-press refresh backoff, capped so a device that never reports back stops polling
+PRESS_REFRESH_DELAYS = (0.5, 1.0, 2.0)
+PRESS_REFRESH_MAX_SECONDS = 5.0
+
+_MISSING = object()
+
 
 def _camera_controller_available(device: PetkitDevices | None) -> bool:
     """Return True when camera controller is loaded for the device."""
@@ -98,8 +108,34 @@ async def _stop_live_action(_api, device: PetkitDevices) -> None:
 
     await controller.async_stop_live_manual()
 
-BUTTON_MAPPING: dict[type[PetkitDevices], list[PetKitButtonDesc]] = {
-    Feeder: [
+
+def _send_command(
+    command: str, params: dict | None = None
+) -> Callable[[PetKitClient, PetkitDevices], Awaitable[None]]:
+    """Return a button action sending one fixed API command."""
+    if params is None:
+
+        def _action(api: PetKitClient, device: PetkitDevices) -> Awaitable[None]:
+            return api.send_api_request(device.id, command)
+
+    else:
+
+        def _action(api: PetKitClient, device: PetkitDevices) -> Awaitable[None]:
+            return api.send_api_request(device.id, command, params)
+
+    return _action
+
+
+def _control_device(
+    action: str, command: int
+) -> Callable[[PetKitClient, PetkitDevices], Awaitable[None]]:
+    """Return a button action sending a fixed control_device payload."""
+    return _send_command(DeviceCommand.CONTROL_DEVICE, {action: command})
+
+
+def _build_feeder_buttons() -> list[PetKitButtonDesc]:
+    """Return the button descriptions for Feeder devices."""
+    return [
         *COMMON_ENTITIES,
         PetKitButtonDesc(
             key="Start live",
@@ -122,37 +158,33 @@ BUTTON_MAPPING: dict[type[PetkitDevices], list[PetKitButtonDesc]] = {
         PetKitButtonDesc(
             key="Reset desiccant",
             translation_key="reset_desiccant",
-            action=lambda api, device: api.send_api_request(
-                device.id, FeederCommand.RESET_DESICCANT
-            ),
+            action=_send_command(FeederCommand.RESET_DESICCANT),
             only_for_types=DEVICES_FEEDER,
         ),
         PetKitButtonDesc(
             key="Cancel manual feed",
             translation_key="cancel_manual_feed",
-            action=lambda api, device: api.send_api_request(
-                device.id, FeederCommand.CANCEL_MANUAL_FEED
-            ),
+            action=_send_command(FeederCommand.CANCEL_MANUAL_FEED),
             only_for_types=DEVICES_FEEDER,
         ),
         PetKitButtonDesc(
             key="Call pet",
             translation_key="call_pet",
-            action=lambda api, device: api.send_api_request(
-                device.id, FeederCommand.CALL_PET
-            ),
+            action=_send_command(FeederCommand.CALL_PET),
             only_for_types=[D3],
         ),
         PetKitButtonDesc(
             key="Food replenished",
             translation_key="food_replenished",
-            action=lambda api, device: api.send_api_request(
-                device.id, FeederCommand.FOOD_REPLENISHED
-            ),
+            action=_send_command(FeederCommand.FOOD_REPLENISHED),
             only_for_types=[D4S, D4H, D4SH],
         ),
-    ],
-    Litter: [
+    ]
+
+
+def _build_litter_buttons() -> list[PetKitButtonDesc]:
+    """Return the button descriptions for Litter devices."""
+    return [
         *COMMON_ENTITIES,
         PetKitButtonDesc(
             key="Start live",
@@ -175,33 +207,21 @@ BUTTON_MAPPING: dict[type[PetkitDevices], list[PetKitButtonDesc]] = {
         PetKitButtonDesc(
             key="Scoop",
             translation_key="start_scoop",
-            action=lambda api, device: api.send_api_request(
-                device.id,
-                DeviceCommand.CONTROL_DEVICE,
-                {DeviceAction.START: LBCommand.CLEANING},
-            ),
+            action=_control_device(DeviceAction.START, LBCommand.CLEANING),
             only_for_types=DEVICES_LITTER_BOX,
             is_available=lambda device: device.state.work_state is None,
         ),
         PetKitButtonDesc(
             key="Maintenance mode",
             translation_key="start_maintenance",
-            action=lambda api, device: api.send_api_request(
-                device.id,
-                DeviceCommand.CONTROL_DEVICE,
-                {DeviceAction.START: LBCommand.MAINTENANCE},
-            ),
+            action=_control_device(DeviceAction.START, LBCommand.MAINTENANCE),
             only_for_types=[T4, T5],
             is_available=lambda device: device.state.work_state is None,
         ),
         PetKitButtonDesc(
             key="Exit maintenance mode",
             translation_key="exit_maintenance",
-            action=lambda api, device: api.send_api_request(
-                device.id,
-                DeviceCommand.CONTROL_DEVICE,
-                {DeviceAction.END: LBCommand.MAINTENANCE},
-            ),
+            action=_control_device(DeviceAction.END, LBCommand.MAINTENANCE),
             only_for_types=[T4, T5],
             is_available=lambda device: device.state.work_state is not None
             and device.state.work_state.work_mode == 9,
@@ -209,11 +229,7 @@ BUTTON_MAPPING: dict[type[PetkitDevices], list[PetKitButtonDesc]] = {
         PetKitButtonDesc(
             key="Dump litter",
             translation_key="dump_litter",
-            action=lambda api, device: api.send_api_request(
-                device.id,
-                DeviceCommand.CONTROL_DEVICE,
-                {DeviceAction.START: LBCommand.DUMPING},
-            ),
+            action=_control_device(DeviceAction.START, LBCommand.DUMPING),
             only_for_types=DEVICES_LITTER_BOX,
             ignore_types=[T7],  # T7 does not support Dumping
             is_available=lambda device: device.state.work_state is None,
@@ -267,11 +283,7 @@ BUTTON_MAPPING: dict[type[PetkitDevices], list[PetKitButtonDesc]] = {
             # For T3/T4 only
             key="Deodorize T3 T4",
             translation_key="deodorize",
-            action=lambda api, device: api.send_api_request(
-                device.id,
-                DeviceCommand.CONTROL_DEVICE,
-                {DeviceAction.START: LBCommand.ODOR_REMOVAL},
-            ),
+            action=_control_device(DeviceAction.START, LBCommand.ODOR_REMOVAL),
             only_for_types=[T4],
             value=lambda device: device.k3_device,
         ),
@@ -279,11 +291,7 @@ BUTTON_MAPPING: dict[type[PetkitDevices], list[PetKitButtonDesc]] = {
             # For T5 / T7 only using the N60 deodorizer
             key="Deodorize T5 T7",
             translation_key="deodorize",
-            action=lambda api, device: api.send_api_request(
-                device.id,
-                DeviceCommand.CONTROL_DEVICE,
-                {DeviceAction.START: LBCommand.ODOR_REMOVAL},
-            ),
+            action=_control_device(DeviceAction.START, LBCommand.ODOR_REMOVAL),
             only_for_types=[T5, T7],
             force_add=[T5, T7],
             is_available=lambda device: device.state.refresh_state is None,
@@ -291,34 +299,28 @@ BUTTON_MAPPING: dict[type[PetkitDevices], list[PetKitButtonDesc]] = {
         PetKitButtonDesc(
             key="Reset N50 odor eliminator",
             translation_key="reset_n50_odor_eliminator",
-            action=lambda api, device: api.send_api_request(
-                device.id, LitterCommand.RESET_N50_DEODORIZER
-            ),
+            action=_send_command(LitterCommand.RESET_N50_DEODORIZER),
             only_for_types=DEVICES_LITTER_BOX,
             ignore_types=[T7],
         ),
         PetKitButtonDesc(
             key="Reset N60 odor eliminator",
             translation_key="reset_n60_odor_eliminator",
-            action=lambda api, device: api.send_api_request(
-                device.id,
-                DeviceCommand.CONTROL_DEVICE,
-                {DeviceAction.START: LBCommand.RESET_N60_DEODOR},
-            ),
+            action=_control_device(DeviceAction.START, LBCommand.RESET_N60_DEODOR),
             only_for_types=LITTER_WITH_CAMERA,
         ),
         PetKitButtonDesc(
             key="Level litter",
             translation_key="level_litter",
-            action=lambda api, device: api.send_api_request(
-                device.id,
-                DeviceCommand.CONTROL_DEVICE,
-                {DeviceAction.START: LBCommand.LEVELING},
-            ),
+            action=_control_device(DeviceAction.START, LBCommand.LEVELING),
             is_available=lambda device: device.state.work_state is None,
         ),
-    ],
-    WaterFountain: [
+    ]
+
+
+def _build_water_fountain_buttons() -> list[PetKitButtonDesc]:
+    """Return the button descriptions for WaterFountain devices."""
+    return [
         *COMMON_ENTITIES,
         PetKitButtonDesc(
             key="Reset filter",
@@ -328,12 +330,41 @@ BUTTON_MAPPING: dict[type[PetkitDevices], list[PetKitButtonDesc]] = {
             ),
             only_for_types=DEVICES_WATER_FOUNTAIN,
         ),
-    ],
-    Purifier: [*COMMON_ENTITIES],
-    Pet: [*COMMON_ENTITIES],
+    ]
+
+
+def _build_purifier_buttons() -> list[PetKitButtonDesc]:
+    """Return the button descriptions for Purifier devices."""
+    return [*COMMON_ENTITIES]
+
+
+def _build_pet_buttons() -> list[PetKitButtonDesc]:
+    """Return the button descriptions for Pet devices."""
+    return [*COMMON_ENTITIES]
+
+
+_BUTTON_BUILDERS: dict[type[PetkitDevices], Callable[[], list[PetKitButtonDesc]]] = {
+    Feeder: _build_feeder_buttons,
+    Litter: _build_litter_buttons,
+    WaterFountain: _build_water_fountain_buttons,
+    Purifier: _build_purifier_buttons,
+    Pet: _build_pet_buttons,
 }
 
 
+@cache
+def _descriptions_for_class(
+    device_class: type[PetkitDevices],
+) -> tuple[PetKitButtonDesc, ...]:
+    """Build the button descriptions for a device class on first use."""
+    return tuple(
+        entity_description
+        for device_type, builder in _BUTTON_BUILDERS.items()
+        if issubclass(device_class, device_type)
+        for entity_description in builder()
+    )
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: PetkitConfigEntry,
@@ -341,6 +372,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up binary_sensors using config entry."""
     devices = entry.runtime_data.client.petkit_entities.values()
+    # Without a value lambda, support only depends on the device class and type
+    supported_by_type: dict[tuple[type, str | None, str], bool] = {}
+
+    def _is_supported(
+        entity_description: PetKitButtonDesc, device: PetkitDevices
+    ) -> bool:
+        if entity_description.value is not None:
+            return entity_description.is_supported(device)
+        cache_key = (
+            type(device),
+            getattr(device.device_nfo, "device_type", None),
+            entity_description.key,
+        )
+        supported = supported_by_type.get(cache_key)
+        if supported is None:
+            supported = entity_description.is_supported(device)
+            supported_by_type[cache_key] = supported
+        return supported
+
     entities = [
         PetkitButton(
             coordinator=entry.runtime_data.coordinator,
@@ -348,15 +398,16 @@ async def async_setup_entry(
             device=device,
         )
         for device in devices
-        for device_type, entity_descriptions in BUTTON_MAPPING.items()
-        if isinstance(device, device_type)
-        for entity_description in entity_descriptions
-        if entity_description.is_supported(device)  # Check if the entity is supported
+        for entity_description in _descriptions_for_class(type(device))
+        if _is_supported(entity_description, device)  # Check if the entity is supported
     ]
     LOGGER.debug(
         "BUTTON : Adding %s (on %s available)",
         len(entities),
-        sum(len(descriptors) for descriptors in BUTTON_MAPPING.values()),
+        sum(
+            len(_descriptions_for_class(device_class))
+            for device_class in {type(device) for device in devices}
+        ),
     )
     async_add_entities(entities)
 
@@ -374,40 +425,60 @@ class PetkitButton(PetkitEntity, ButtonEntity):
     ) -> None:
         """Initialize the switch class."""
         super().__init__(coordinator, device)
-        self.coordinator = coordinator
         self.entity_description = entity_description
-        self.device = device
+        self._is_available = entity_description.is_available
 
     @property
     def available(self) -> bool:
         """Only make available if device is online."""
 
         device_data = self.coordinator.data.get(self.device.id)
-        try:
-            if device_data.state.pim not in POWER_ONLINE_STATE:
-                return False
-        except AttributeError:
-            pass
-
-        if self.entity_description.is_available:
-            is_available = self.entity_description.is_available(device_data)
-            LOGGER.debug(
-                "Button %s availability result is: %s",
-                self.entity_description.key,
-                is_available,
-            )
+        # Devices without a state or pim (e.g. pets) skip the power check
+        pim = getattr(getattr(device_data, "state", None), "pim", _MISSING)
+        if pim is not _MISSING and pim not in POWER_ONLINE_STATE:
+            return False
+
+        if self._is_available is not None:
+            is_available = self._is_available(device_data)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(
+                    "Button %s availability result is: %s",
+                    self.entity_description.key,
+                    is_available,
+                )
             return is_available
 
         return True
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        LOGGER.debug("Button pressed: %s", self.entity_description.key)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Button pressed: %s", self.entity_description.key)
         if self.entity_description.enable_smart_polling:
             self.coordinator.enable_smart_polling(12)
         await self.entity_description.action(
             self.coordinator.config_entry.runtime_data.client, self.device
         )
         if self.entity_description.refresh_after_press:
-            await asyncio.sleep(1.5)
-            await self.coordinator.async_request_refresh()
+            self.coordinator.config_entry.async_create_background_task(
+                self.hass,
+                self._poll_until_state_change(
+                    self.coordinator.data.get(self.device.id)
+                ),
+                f"petkit_button_refresh_{self.device.id}_{self.entity_description.key}",
+            )
+
+    async def _poll_until_state_change(self, previous: PetkitDevices | None) -> None:
+        """Refresh with backoff until the device data differs from before the press."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + PRESS_REFRESH_MAX_SECONDS
+        delays = iter(PRESS_REFRESH_DELAYS)
+        delay = 0.0
+        # The last delay repeats until the deadline
+        while (remaining := deadline - loop.time()) > 0:
+            delay = next(delays, delay)
+            # Shared per coordinator so simultaneous presses trigger a single poll
+            await self.coordinator.press_refresh_debouncer.async_call()
+            await asyncio.sleep(min(delay, remaining))
+            if self.coordinator.data.get(self.device.id) != previous:
+                return
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -25,6 +26,7 @@ from homeassistant.components.camera import (
 )
 from homeassistant.components.web_rtc import async_register_ice_servers
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .agora_api import SERVICE_IDS, AgoraAPIClient, AgoraResponse
@@ -38,11 +40,14 @@ from .const import (
     STREAM_CONTROL_SHARED,
 )
 from .coordinator import PetkitDataUpdateCoordinator
+from .data import PetkitConfigEntry
 from .entity import PetKitDescSensorBase, PetkitCameraBaseEntity
 
 AGORA_APP_ID = "244c49951296440cbc1e3b937bf5e410"
 TEMP_OPEN_CAMERA_COOLDOWN_SECONDS = 45.0
+RTC_TOKEN_REFRESH_COALESCE_SECONDS = 2.0
 _CAMERA_CONTROLLERS: dict[str, "PetkitWebRTCCamera"] = {}
+_REFLEXIVE_CANDIDATE_TYPES = frozenset({"srflx", "prflx"})
 
 
 def get_camera_controller(device_id: str) -> "PetkitWebRTCCamera | None":
@@ -91,17 +96,19 @@ async def async_setup_entry(
             hass=hass,
         )
         for device in devices
-        for device_type, descriptions in CAMERA_MAPPING.items()
-        if isinstance(device, device_type)
-        for entity_description in descriptions
+        # Walk the class hierarchy so each device costs dict lookups, not isinstance
+        for device_class in type(device).__mro__
+        for entity_description in CAMERA_MAPPING.get(device_class, ())
         if entity_description.is_supported(device)
     ]
 
     if entities:
-        results = await asyncio.gather(
-            *(entity.async_prepare_agora() for entity in entities),
-            return_exceptions=True,
-        )
+        # One client for the whole prefetch batch instead of one per camera
+        async with AgoraAPIClient(async_get_clientsession(hass)) as agora_client:
+            results = await asyncio.gather(
+                *(entity.async_prepare_agora(agora_client) for entity in entities),
+                return_exceptions=True,
+            )
         for entity, result in zip(entities, results, strict=False):
             if isinstance(result, Exception):
                 LOGGER.debug(
@@ -128,8 +135,6 @@ class PetkitWebRTCCamera(PetkitCameraBaseEntity):
         """Initialize the camera entity."""
         super().__init__(coordinator, device, entity_description.key)
         self.hass = hass
-        self.coordinator = coordinator
-        self.device = device
         self.entity_description = entity_description
         self._attr_translation_key = entity_description.translation_key
 
@@ -140,8 +145,11 @@ class PetkitWebRTCCamera(PetkitCameraBaseEntity):
         self._agora_response: AgoraResponse | None = None
         self._ice_servers: list[RTCIceServer] = []
         self._last_temporary_open_at = 0.0
+        self._token_refresh_lock = asyncio.Lock()
+        self._last_token_refresh_at = 0.0
 
         self._remove_ice_servers: Callable[[], None] | None = None
+        self._stream_mode = self._resolve_stream_control_mode()
 
     @property
     def available(self) -> bool:
@@ -156,6 +164,11 @@ class PetkitWebRTCCamera(PetkitCameraBaseEntity):
             self.hass,
             self.get_ice_servers,
         )
+        self.async_on_remove(
+            self.coordinator.config_entry.add_update_listener(
+                self._async_options_updated
+            )
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Cleanup callbacks and websocket sessions."""
@@ -164,14 +177,17 @@ class PetkitWebRTCCamera(PetkitCameraBaseEntity):
             self._remove_ice_servers = None
         _CAMERA_CONTROLLERS.pop(str(self.device.id), None)
         await self._async_close_stream()
+        await self._agora_rtm.async_close()
         await super().async_will_remove_from_hass()
 
-    async def async_prepare_agora(self) -> None:
+    async def async_prepare_agora(
+        self, agora_client: AgoraAPIClient | None = None
+    ) -> None:
         """Best-effort prefetch for ICE servers before first offer."""
         live_feed = self._get_live_feed()
         if live_feed is None:
             return
-        await self._refresh_agora_context(live_feed)
+        await self._refresh_agora_context(live_feed, agora_client)
 
     async def async_camera_image(
         self,
@@ -281,6 +297,8 @@ class PetkitWebRTCCamera(PetkitCameraBaseEntity):
 
     async def _async_close_stream(self, send_stop_override: bool | None = None) -> None:
         """Stop signaling control (mode-dependent) and close websocket session."""
+        if not self._agora_handler.is_active and not self._agora_rtm.is_active:
+            return
         send_stop = (
             send_stop_override
             if send_stop_override is not None
@@ -380,6 +398,16 @@ class PetkitWebRTCCamera(PetkitCameraBaseEntity):
         LOGGER.debug("Manual stop_live sent for %s", self.device.id)
 
     def _stream_control_mode(self) -> str:
+        """Return the cached stream control mode."""
+        return self._stream_mode
+
+    async def _async_options_updated(
+        self, hass: HomeAssistant, entry: PetkitConfigEntry
+    ) -> None:
+        """Re-resolve the stream control mode after an options change."""
+        self._stream_mode = self._resolve_stream_control_mode()
+
+    def _resolve_stream_control_mode(self) -> str:
         """Return stream control mode from config entry options."""
         config_entry = self.coordinator.config_entry
         mode = config_entry.options.get(
@@ -391,8 +419,18 @@ class PetkitWebRTCCamera(PetkitCameraBaseEntity):
         return mode
 
     async def _refresh_rtc_token(self) -> str | None:
-        """Fetch fresh live feed tokens and return the latest RTC token."""
-        await self.coordinator.async_request_refresh()
+        """Fetch fresh live feed tokens and return the latest RTC token.
+
+        Concurrent callers share one coordinator refresh, and a refresh that
+        finished moments ago is reused instead of polling again.
+        """
+        async with self._token_refresh_lock:
+            if (
+                time.monotonic() - self._last_token_refresh_at
+                >= RTC_TOKEN_REFRESH_COALESCE_SECONDS
+            ):
+                await self.coordinator.async_request_refresh()
+                self._last_token_refresh_at = time.monotonic()
         live_feed = self._get_live_feed()
         if live_feed is None or not live_feed.rtc_token:
             return None
@@ -434,22 +472,22 @@ class PetkitWebRTCCamera(PetkitCameraBaseEntity):
         """Resolve RTC uid matching PetKit behavior (server-assigned uid 0)."""
         return 0
 
-    async def _refresh_agora_context(self, live_feed: LiveFeed) -> None:
+    async def _refresh_agora_context(
+        self,
+        live_feed: LiveFeed,
+        agora_client: AgoraAPIClient | None = None,
+    ) -> None:
         """Fetch Agora gateway + TURN endpoints and cache ICE servers."""
         rtc_uid = self._resolve_rtc_uid(live_feed)
         self._agora_response = None
 
-        async with AgoraAPIClient() as agora_client:
-            response = await agora_client.choose_server(
-                app_id=AGORA_APP_ID,
-                token=live_feed.rtc_token,
-                channel_name=live_feed.channel_id,
-                user_id=rtc_uid,
-                service_flags=[
-                    SERVICE_IDS["CHOOSE_SERVER"],
-                    SERVICE_IDS["CLOUD_PROXY_FALLBACK"],
-                ],
-            )
+        if agora_client is None:
+            async with AgoraAPIClient(
+                async_get_clientsession(self.hass)
+            ) as owned_client:
+                response = await self._choose_server(owned_client, live_feed, rtc_uid)
+        else:
+            response = await self._choose_server(agora_client, live_feed, rtc_uid)
 
         self._agora_response = response
         ice_servers = response.get_ice_servers(use_all_turn_servers=False)
@@ -462,10 +500,27 @@ class PetkitWebRTCCamera(PetkitCameraBaseEntity):
             for server in ice_servers
         ]
 
-        LOGGER.debug(
-            "Cached %d ICE servers for PetKit camera %s",
-            len(self._ice_servers),
-            self.device.id,
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Cached %d ICE servers for PetKit camera %s",
+                len(self._ice_servers),
+                self.device.id,
+            )
+
+    @staticmethod
+    async def _choose_server(
+        agora_client: AgoraAPIClient, live_feed: LiveFeed, rtc_uid: int
+    ) -> AgoraResponse:
+        """Request gateway and TURN servers for the live feed channel."""
+        return await agora_client.choose_server(
+            app_id=AGORA_APP_ID,
+            token=live_feed.rtc_token,
+            channel_name=live_feed.channel_id,
+            user_id=rtc_uid,
+            service_flags=[
+                SERVICE_IDS["CHOOSE_SERVER"],
+                SERVICE_IDS["CLOUD_PROXY_FALLBACK"],
+            ],
         )
 
     @staticmethod
@@ -480,14 +535,19 @@ class PetkitWebRTCCamera(PetkitCameraBaseEntity):
 
         filtered: list[RTCIceCandidateInit] = []
         for candidate in candidates:
-            candidate_str = candidate.candidate or ""
+            parts = (candidate.candidate or "").split()
+            try:
+                candidate_type = parts[parts.index("typ") + 1]
+            except (ValueError, IndexError):
+                continue
 
-            if "typ srflx" in candidate_str or "typ prflx" in candidate_str:
+            if candidate_type in _REFLEXIVE_CANDIDATE_TYPES:
                 filtered.append(candidate)
                 continue
 
-            if "typ relay" in candidate_str:
-                if not valid_turn_ips or any(ip in candidate_str for ip in valid_turn_ips):
+            if candidate_type == "relay":
+                # Exact token match on the connection/related address
+                if not valid_turn_ips or not valid_turn_ips.isdisjoint(parts):
                     filtered.append(candidate)
                 continue
 
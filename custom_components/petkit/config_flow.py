@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from pypetkitapi import (
@@ -71,6 +72,121 @@ from .const import (
 )
 
 
+_BOOLEAN_SELECTOR = BooleanSelector(BooleanSelectorConfig())
+_SCAN_INTERVAL_VALIDATOR = vol.All(int, vol.Range(min=15, max=3600))
+_SUB_SCAN_INTERVAL_VALIDATOR = vol.All(int, vol.Range(min=5, max=120))
+_DELETE_AFTER_VALIDATOR = vol.All(int, vol.Range(min=0, max=30))
+_STREAM_CONTROL_MODE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            STREAM_CONTROL_SHARED,
+            STREAM_CONTROL_EXCLUSIVE,
+        ]
+    )
+)
+_MEDIA_EV_TYPE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        multiple=True,
+        sort=False,
+        options=[
+            "Pet",
+            "Eat",
+            "Feed",
+            "Toileting",
+            "Move",
+            "Dish_before",
+            "Dish_after",
+            "Waste_check",
+        ],
+    )
+)
+
+_USERNAME_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(
+        type=selector.TextSelectorType.TEXT,
+    ),
+)
+_PASSWORD_SELECTOR = selector.TextSelector(
+    selector.TextSelectorConfig(
+        type=selector.TextSelectorType.PASSWORD,
+    ),
+)
+_REGION_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=sorted(CODE_TO_COUNTRY_DICT.values())),
+)
+_TIME_ZONE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(options=ALL_TIMEZONES_LST),
+)
+
+
+@lru_cache(maxsize=8)
+def _options_schema(
+    *,
+    scan_interval: int,
+    smart_polling: bool,
+    realtime_mqtt: bool,
+    stream_control_mode: str,
+    media_path: str,
+    scan_interval_media: int,
+    media_dl_image: bool,
+    media_dl_video: bool,
+    media_ev_type: tuple[str, ...],
+    delete_after: int,
+    ble_relay_enabled: bool,
+    scan_interval_bluetooth: int,
+) -> vol.Schema:
+    """Return the options schema for the given defaults, compiled once per set."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_SCAN_INTERVAL, default=scan_interval
+            ): _SCAN_INTERVAL_VALIDATOR,
+            vol.Required(CONF_SMART_POLLING, default=smart_polling): _BOOLEAN_SELECTOR,
+            vol.Required(CONF_REALTIME_MQTT, default=realtime_mqtt): _BOOLEAN_SELECTOR,
+            vol.Required(
+                CONF_STREAM_CONTROL_MODE, default=stream_control_mode
+            ): _STREAM_CONTROL_MODE_SELECTOR,
+            vol.Required(MEDIA_SECTION): section(
+                vol.Schema(
+                    {
+                        vol.Required(CONF_MEDIA_PATH, default=media_path): vol.All(str),
+                        vol.Required(
+                            CONF_SCAN_INTERVAL_MEDIA, default=scan_interval_media
+                        ): _SUB_SCAN_INTERVAL_VALIDATOR,
+                        vol.Required(
+                            CONF_MEDIA_DL_IMAGE, default=media_dl_image
+                        ): _BOOLEAN_SELECTOR,
+                        vol.Required(
+                            CONF_MEDIA_DL_VIDEO, default=media_dl_video
+                        ): _BOOLEAN_SELECTOR,
+                        vol.Optional(
+                            CONF_MEDIA_EV_TYPE, default=list(media_ev_type)
+                        ): _MEDIA_EV_TYPE_SELECTOR,
+                        vol.Required(
+                            CONF_DELETE_AFTER, default=delete_after
+                        ): _DELETE_AFTER_VALIDATOR,
+                    }
+                ),
+                {"collapsed": False},
+            ),
+            vol.Required(BT_SECTION): section(
+                vol.Schema(
+                    {
+                        vol.Required(
+                            CONF_BLE_RELAY_ENABLED, default=ble_relay_enabled
+                        ): _BOOLEAN_SELECTOR,
+                        vol.Required(
+                            CONF_SCAN_INTERVAL_BLUETOOTH,
+                            default=scan_interval_bluetooth,
+                        ): _SUB_SCAN_INTERVAL_VALIDATOR,
+                    }
+                ),
+                {"collapsed": False},
+            ),
+        }
+    )
+
+
 class PetkitOptionsFlowHandler(OptionsFlow):
     """Handle Petkit options."""
 
@@ -81,128 +197,34 @@ class PetkitOptionsFlowHandler(OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(data=user_input)
 
+        options = self.config_entry.options
+        media_options = options.get(MEDIA_SECTION, {})
+        bt_options = options.get(BT_SECTION, {})
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_SCAN_INTERVAL,
-                        default=self.config_entry.options.get(
-                            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-                        ),
-                    ): vol.All(int, vol.Range(min=15, max=3600)),
-                    vol.Required(
-                        CONF_SMART_POLLING,
-                        default=self.config_entry.options.get(
-                            CONF_SMART_POLLING, DEFAULT_SMART_POLLING
-                        ),
-                    ): BooleanSelector(BooleanSelectorConfig()),
-                    vol.Required(
-                        CONF_REALTIME_MQTT,
-                        default=self.config_entry.options.get(
-                            CONF_REALTIME_MQTT, DEFAULT_REALTIME_MQTT
-                        ),
-                    ): BooleanSelector(BooleanSelectorConfig()),
-                    vol.Required(
-                        CONF_STREAM_CONTROL_MODE,
-                        default=self.config_entry.options.get(
-                            CONF_STREAM_CONTROL_MODE,
-                            DEFAULT_STREAM_CONTROL_MODE,
-                        ),
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=[
-                                STREAM_CONTROL_SHARED,
-                                STREAM_CONTROL_EXCLUSIVE,
-                            ]
-                        )
-                    ),
-                    vol.Required(MEDIA_SECTION): section(
-                        vol.Schema(
-                            {
-                                vol.Required(
-                                    CONF_MEDIA_PATH,
-                                    default=self.config_entry.options.get(
-                                        MEDIA_SECTION, {}
-                                    ).get(CONF_MEDIA_PATH, DEFAULT_MEDIA_PATH),
-                                ): vol.All(str),
-                                vol.Required(
-                                    CONF_SCAN_INTERVAL_MEDIA,
-                                    default=self.config_entry.options.get(
-                                        MEDIA_SECTION, {}
-                                    ).get(
-                                        CONF_SCAN_INTERVAL_MEDIA,
-                                        DEFAULT_SCAN_INTERVAL_MEDIA,
-                                    ),
-                                ): vol.All(int, vol.Range(min=5, max=120)),
-                                vol.Required(
-                                    CONF_MEDIA_DL_IMAGE,
-                                    default=self.config_entry.options.get(
-                                        MEDIA_SECTION, {}
-                                    ).get(CONF_MEDIA_DL_IMAGE, DEFAULT_DL_IMAGE),
-                                ): BooleanSelector(BooleanSelectorConfig()),
-                                vol.Required(
-                                    CONF_MEDIA_DL_VIDEO,
-                                    default=self.config_entry.options.get(
-                                        MEDIA_SECTION, {}
-                                    ).get(CONF_MEDIA_DL_VIDEO, DEFAULT_DL_VIDEO),
-                                ): BooleanSelector(BooleanSelectorConfig()),
-                                vol.Optional(
-                                    CONF_MEDIA_EV_TYPE,
-                                    default=self.config_entry.options.get(
-                                        MEDIA_SECTION, {}
-                                    ).get(CONF_MEDIA_EV_TYPE, DEFAULT_EVENTS),
-                                ): selector.SelectSelector(
-                                    selector.SelectSelectorConfig(
-                                        multiple=True,
-                                        sort=False,
-                                        options=[
-                                            "Pet",
-                                            "Eat",
-                                            "Feed",
-                                            "Toileting",
-                                            "Move",
-                                            "Dish_before",
-                                            "Dish_after",
-                                            "Waste_check",
-                                        ],
-                                    )
-                                ),
-                                vol.Required(
-                                    CONF_DELETE_AFTER,
-                                    default=self.config_entry.options.get(
-                                        MEDIA_SECTION, {}
-                                    ).get(CONF_DELETE_AFTER, DEFAULT_DELETE_AFTER),
-                                ): vol.All(int, vol.Range(min=0, max=30)),
-                            }
-                        ),
-                        {"collapsed": False},
-                    ),
-                    vol.Required(BT_SECTION): section(
-                        vol.Schema(
-                            {
-                                vol.Required(
-                                    CONF_BLE_RELAY_ENABLED,
-                                    default=self.config_entry.options.get(
-                                        BT_SECTION, {}
-                                    ).get(
-                                        CONF_BLE_RELAY_ENABLED, DEFAULT_BLUETOOTH_RELAY
-                                    ),
-                                ): BooleanSelector(BooleanSelectorConfig()),
-                                vol.Required(
-                                    CONF_SCAN_INTERVAL_BLUETOOTH,
-                                    default=self.config_entry.options.get(
-                                        BT_SECTION, {}
-                                    ).get(
-                                        CONF_SCAN_INTERVAL_BLUETOOTH,
-                                        DEFAULT_SCAN_INTERVAL_BLUETOOTH,
-                                    ),
-                                ): vol.All(int, vol.Range(min=5, max=120)),
-                            }
-                        ),
-                        {"collapsed": False},
-                    ),
-                }
+            data_schema=_options_schema(
+                scan_interval=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                smart_polling=options.get(CONF_SMART_POLLING, DEFAULT_SMART_POLLING),
+                realtime_mqtt=options.get(CONF_REALTIME_MQTT, DEFAULT_REALTIME_MQTT),
+                stream_control_mode=options.get(
+                    CONF_STREAM_CONTROL_MODE, DEFAULT_STREAM_CONTROL_MODE
+                ),
+                media_path=media_options.get(CONF_MEDIA_PATH, DEFAULT_MEDIA_PATH),
+                scan_interval_media=media_options.get(
+                    CONF_SCAN_INTERVAL_MEDIA, DEFAULT_SCAN_INTERVAL_MEDIA
+                ),
+                media_dl_image=media_options.get(CONF_MEDIA_DL_IMAGE, DEFAULT_DL_IMAGE),
+                media_dl_video=media_options.get(CONF_MEDIA_DL_VIDEO, DEFAULT_DL_VIDEO),
+                media_ev_type=tuple(
+                    media_options.get(CONF_MEDIA_EV_TYPE, DEFAULT_EVENTS)
+                ),
+                delete_after=media_options.get(CONF_DELETE_AFTER, DEFAULT_DELETE_AFTER),
+                ble_relay_enabled=bt_options.get(
+                    CONF_BLE_RELAY_ENABLED, DEFAULT_BLUETOOTH_RELAY
+                ),
+                scan_interval_bluetooth=bt_options.get(
+                    CONF_SCAN_INTERVAL_BLUETOOTH, DEFAULT_SCAN_INTERVAL_BLUETOOTH
+                ),
             ),
         )
 
@@ -230,7 +252,9 @@ class PetkitFlowHandler(ConfigFlow, domain=DOMAIN):
         country_from_ha = self.hass.config.country
         tz_from_ha = self.hass.config.time_zone
         LOGGER.debug(
-            f"Country code from HA : {self.hass.config.country} Default timezone: {tz_from_ha}"
+            "Country code from HA : %s Default timezone: %s",
+            country_from_ha,
+            tz_from_ha,
         )
 
         if user_input is not None:
@@ -239,70 +263,58 @@ class PetkitFlowHandler(ConfigFlow, domain=DOMAIN):
                 or country_from_ha
             )
 
-            # Check if the account already exists
-            existing_entries = self._async_current_entries()
-            for entry in existing_entries:
-                if entry.data.get(CONF_USERNAME) == user_input[CONF_USERNAME]:
-                    _errors["base"] = "account_exists"
-                    break
+            # Abort if the account is already configured
+            self._async_abort_entries_match({CONF_USERNAME: user_input[CONF_USERNAME]})
+
+            try:
+                await self._test_credentials(
+                    username=user_input[CONF_USERNAME],
+                    password=user_input[CONF_PASSWORD],
+                    region=user_region,
+                    timezone=user_input.get(CONF_TIME_ZONE, tz_from_ha),
+                )
+            except (
+                PetkitTimeoutError,
+                PetkitSessionError,
+                PetkitSessionExpiredError,
+                PetkitAuthenticationUnregisteredEmailError,
+                PetkitRegionalServerNotFoundError,
+            ) as exception:
+                LOGGER.error(exception)
+                _errors["base"] = str(exception)
+            except PypetkitError as exception:
+                LOGGER.error(exception)
+                _errors["base"] = "error"
             else:
-                try:
-                    await self._test_credentials(
-                        username=user_input[CONF_USERNAME],
-                        password=user_input[CONF_PASSWORD],
-                        region=user_region,
-                        timezone=user_input.get(CONF_TIME_ZONE, tz_from_ha),
-                    )
-                except (
-                    PetkitTimeoutError,
-                    PetkitSessionError,
-                    PetkitSessionExpiredError,
-                    PetkitAuthenticationUnregisteredEmailError,
-                    PetkitRegionalServerNotFoundError,
-                ) as exception:
-                    LOGGER.error(exception)
-                    _errors["base"] = str(exception)
-                except PypetkitError as exception:
-                    LOGGER.error(exception)
-                    _errors["base"] = "error"
-                else:
-                    return self.async_create_entry(
-                        title=user_input[CONF_USERNAME],
-                        data=user_input,
-                        options={
-                            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
-                            CONF_SMART_POLLING: DEFAULT_SMART_POLLING,
-                            CONF_REALTIME_MQTT: DEFAULT_REALTIME_MQTT,
-                            CONF_STREAM_CONTROL_MODE: DEFAULT_STREAM_CONTROL_MODE,
-                            MEDIA_SECTION: {
-                                CONF_MEDIA_PATH: DEFAULT_MEDIA_PATH,
-                                CONF_SCAN_INTERVAL_MEDIA: DEFAULT_SCAN_INTERVAL_MEDIA,
-                                CONF_MEDIA_DL_IMAGE: DEFAULT_DL_IMAGE,
-                                CONF_MEDIA_DL_VIDEO: DEFAULT_DL_VIDEO,
-                                CONF_MEDIA_EV_TYPE: DEFAULT_EVENTS,
-                                CONF_DELETE_AFTER: DEFAULT_DELETE_AFTER,
-                            },
-                            BT_SECTION: {
-                                CONF_BLE_RELAY_ENABLED: DEFAULT_BLUETOOTH_RELAY,
-                                CONF_SCAN_INTERVAL_BLUETOOTH: DEFAULT_SCAN_INTERVAL_BLUETOOTH,
-                            },
+                return self.async_create_entry(
+                    title=user_input[CONF_USERNAME],
+                    data=user_input,
+                    options={
+                        CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+                        CONF_SMART_POLLING: DEFAULT_SMART_POLLING,
+                        CONF_REALTIME_MQTT: DEFAULT_REALTIME_MQTT,
+                        CONF_STREAM_CONTROL_MODE: DEFAULT_STREAM_CONTROL_MODE,
+                        MEDIA_SECTION: {
+                            CONF_MEDIA_PATH: DEFAULT_MEDIA_PATH,
+                            CONF_SCAN_INTERVAL_MEDIA: DEFAULT_SCAN_INTERVAL_MEDIA,
+                            CONF_MEDIA_DL_IMAGE: DEFAULT_DL_IMAGE,
+                            CONF_MEDIA_DL_VIDEO: DEFAULT_DL_VIDEO,
+                            CONF_MEDIA_EV_TYPE: DEFAULT_EVENTS,
+                            CONF_DELETE_AFTER: DEFAULT_DELETE_AFTER,
+                        },
+                        BT_SECTION: {
+                            CONF_BLE_RELAY_ENABLED: DEFAULT_BLUETOOTH_RELAY,
+                            CONF_SCAN_INTERVAL_BLUETOOTH: DEFAULT_SCAN_INTERVAL_BLUETOOTH,
                         },
-                    )
+                    },
+                )
 
         data_schema = {
             vol.Required(
                 CONF_USERNAME,
                 default=(user_input or {}).get(CONF_USERNAME, vol.UNDEFINED),
-            ): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.TEXT,
-                ),
-            ),
-            vol.Required(CONF_PASSWORD): selector.TextSelector(
-                selector.TextSelectorConfig(
-                    type=selector.TextSelectorType.PASSWORD,
-                ),
-            ),
+            ): _USERNAME_SELECTOR,
+            vol.Required(CONF_PASSWORD): _PASSWORD_SELECTOR,
         }
 
         if _errors:
@@ -313,16 +325,10 @@ class PetkitFlowHandler(ConfigFlow, domain=DOMAIN):
                         default=CODE_TO_COUNTRY_DICT.get(
                             country_from_ha, country_from_ha
                         ),
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(
-                            options=sorted(CODE_TO_COUNTRY_DICT.values())
-                        ),
-                    ),
+                    ): _REGION_SELECTOR,
                     vol.Required(
                         CONF_TIME_ZONE, default=tz_from_ha
-                    ): selector.SelectSelector(
-                        selector.SelectSelectorConfig(options=ALL_TIMEZONES_LST),
-                    ),
+                    ): _TIME_ZONE_SELECTOR,
                 }
             )
 
@@ -343,5 +349,5 @@ class PetkitFlowHandler(ConfigFlow, domain=DOMAIN):
             timezone=timezone,
             session=async_get_clientsession(self.hass),
         )
-        LOGGER.debug(f"Testing credentials for {username}")
+        LOGGER.debug("Testing credentials for %s", username)
         await client.login()
@@ -61,6 +61,7 @@ MEDIA_ROOT = "/media/local"
 # Update interval
 MAX_SCAN_INTERVAL = 120
 MIN_SCAN_INTERVAL = 5
+PRESS_REFRESH_COOLDOWN = 0.25
 
 # Petkit devices types to name translation
 PETKIT_DEVICES_MAPPING = {
@@ -94,7 +95,7 @@ PETKIT_DEVICES_MAPPING = {
 NO_ERROR = "No error"
 
 # Status mapping
-POWER_ONLINE_STATE = [1, 2]
+POWER_ONLINE_STATE = frozenset({1, 2})
 
 DEVICE_STATUS_MAP = {
     0: "Offline",
@@ -30,6 +30,7 @@ from pypetkitapi import (
 
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -53,6 +54,7 @@ from .const import (
     LOGGER,
     MEDIA_SECTION,
     MIN_SCAN_INTERVAL,
+    PRESS_REFRESH_COOLDOWN,
 )
 
 
@@ -72,6 +74,19 @@ class PetkitDataUpdateCoordinator(DataUpdateCoordinator):
         self.previous_devices = set()
         self.curent_devices = set()
         self.fast_poll_tic = 0
+        # Collapses post-press refreshes from buttons pressed close together
+        self.press_refresh_debouncer = Debouncer(
+            hass,
+            logger,
+            cooldown=PRESS_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self.async_refresh,
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending press refreshes before shutting down."""
+        self.press_refresh_debouncer.async_shutdown()
+        await super().async_shutdown()
 
     def enable_smart_polling(self, nb_tic: int) -> None:
         """Enable smart polling."""
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pypetkitapi import Feeder, Litter, Pet, Purifier, WaterFountain
 
@@ -26,7 +26,7 @@ type PetkitConfigEntry = ConfigEntry[PetkitData]
 type PetkitDevices = Feeder | Litter | WaterFountain | Purifier | Pet
 
 
-@dataclass
+@dataclass(slots=True)
 class PetkitData:
     """Data for the Petkit integration."""
 
@@ -36,3 +36,5 @@ class PetkitData:
     coordinator_bluetooth: PetkitBluetoothUpdateCoordinator
     integration: Integration
     mqtt_listener: PetkitIotMqttListener | None = None
+    # Entry data/options the integration was last set up with
+    config_snapshot: tuple[dict[str, Any], dict[str, Any]] | None = None
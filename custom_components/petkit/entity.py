@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from abc import ABC
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from dataclasses import dataclass
+from functools import lru_cache
+import logging
 from typing import Any, Generic, TypeVar
 
 from pypetkitapi import Feeder, Litter, Pet, Purifier, WaterFountain
@@ -23,6 +25,58 @@ from .coordinator import (
 from .data import PetkitDevices
 
 _DevicesT = TypeVar("_DevicesT", bound=Feeder | Litter | WaterFountain | Purifier | Pet)
+_SUPPORTED_DEVICE_TYPES = (Feeder, Litter, WaterFountain, Purifier, Pet)
+
+
+@lru_cache(maxsize=64)
+def _device_model(type_code: int | None, device_type: str) -> str:
+    """Return the model name for a type code and device type."""
+    return PETKIT_DEVICES_MAPPING.get(
+        f"{type_code}{device_type.lower()}", "Unknown Device"
+    )
+
+
+def _device_info_version(device: PetkitDevices) -> tuple[Any, ...]:
+    """Return the device fields DeviceInfo is derived from."""
+    return (
+        device.name,
+        getattr(device, "mac", None),
+        getattr(device, "firmware", None),
+        getattr(device, "hardware", None),
+    )
+
+
+def _build_device_info(device: PetkitDevices) -> DeviceInfo:
+    """Build the DeviceInfo registered for a PetKit device."""
+    if device.device_nfo.device_type:
+        device_type = device.device_nfo.device_type
+        device_model = _device_model(device.device_nfo.type_code, device_type)
+    else:
+        device_type = "Unknown"
+        device_model = "Unknown Device"
+
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, device.sn)},
+        manufacturer="Petkit",
+        model=device_model,
+        model_id=device_type.upper(),
+        name=device.name,
+    )
+
+    if not isinstance(device, Pet):
+        if device.mac is not None:
+            device_info["connections"] = {(CONNECTION_NETWORK_MAC, device.mac)}
+
+        if device.firmware is not None:
+            device_info["sw_version"] = str(device.firmware)
+
+        if device.hardware is not None:
+            device_info["hw_version"] = str(device.hardware)
+
+        if device.sn is not None:
+            device_info["serial_number"] = str(device.sn)
+
+    return device_info
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -30,74 +84,73 @@ class PetKitDescSensorBase(EntityDescription):
     """A class that describes sensor entities."""
 
     value: Callable[[_DevicesT], Any] | None = None
-    ignore_types: list[str] | None = None  # List of device types to ignore
-    only_for_types: list[str] | None = None  # List of device types to support
-    force_add: list[str] | None = None
+    ignore_types: Collection[str] | None = None  # List of device types to ignore
+    only_for_types: Collection[str] | None = None  # List of device types to support
+    force_add: Collection[str] | None = None
     entity_picture: Callable[[PetkitDevices], str | None] | None = None
 
+    def __post_init__(self) -> None:
+        """Store the device type lists as lowercase frozensets for fast lookups."""
+        for field_name in ("ignore_types", "only_for_types", "force_add"):
+            if not (types := getattr(self, field_name)):
+                object.__setattr__(self, field_name, None)
+            elif not isinstance(types, str):
+                # A bare string (e.g. FEEDER_MINI) keeps its substring matching,
+                # which the legacy "feeder" type relies on
+                object.__setattr__(self, field_name, frozenset(map(str.lower, types)))
+
     def is_supported(self, device: _DevicesT) -> bool:
         """Check if the entity is supported by trying to execute the value lambda."""
 
-        if not isinstance(device, Feeder | Litter | WaterFountain | Purifier | Pet):
+        if not isinstance(device, _SUPPORTED_DEVICE_TYPES):
             LOGGER.error(
-                f"Device instance is not of expected type: {type(device)} can't check support"
+                "Device instance is not of expected type: %s can't check support",
+                type(device),
             )
             return False
 
         device_type = getattr(device.device_nfo, "device_type", None)
         if not device_type:
-            LOGGER.error(f"Entities {device.name} has no type, can't check support")
+            LOGGER.error("Entities %s has no type, can't check support", device.name)
             return False
         device_type = device_type.lower()
 
-        if self._is_force_added(device_type):
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
+        if self.force_add and device_type in self.force_add:
+            if debug:
+                LOGGER.debug("%s force add for '%s'", device_type, self.key)
             return True
 
-        if self._is_ignored(device_type):
+        # only_for_types rejects the most candidates, so it is checked first
+        if self.only_for_types and device_type not in self.only_for_types:
+            if debug:
+                LOGGER.debug("%s is NOT COMPATIBLE with '%s'", device_type, self.key)
             return False
 
-        if self._is_not_in_supported_types(device_type):
+        if self.ignore_types and device_type in self.ignore_types:
+            if debug:
+                LOGGER.debug("%s force ignore for '%s'", device_type, self.key)
             return False
 
-        return self._check_value_support(device)
-
-    def _is_force_added(self, device_type: str) -> bool:
-        """Check if the device is in the force_add list."""
-        if self.force_add and device_type in self.force_add:
-            LOGGER.debug(f"{device_type} force add for '{self.key}'")
+        if self.value is None:
             return True
-        return False
 
-    def _is_ignored(self, device_type: str) -> bool:
-        """Check if the device is in the ignore_types list."""
-        if self.ignore_types and device_type in self.ignore_types:
-            LOGGER.debug(f"{device_type} force ignore for '{self.key}'")
-            return True
-        return False
-
-    def _is_not_in_supported_types(self, device_type: str) -> bool:
-        """Check if the device is not in the only_for_types list."""
-        if self.only_for_types and device_type not in self.only_for_types:
-            LOGGER.debug(f"{device_type} is NOT COMPATIBLE with '{self.key}'")
-            return True
-        return False
-
-    def _check_value_support(self, device: _DevicesT) -> bool:
-        """Check if the device supports the value lambda."""
-        if self.value is not None:
-            try:
-                result = self.value(device)
-                if result is None:
-                    LOGGER.debug(
-                        f"{device.device_nfo.device_type} DOES NOT support '{self.key}' (value is None)"
-                    )
-                    return False
-                LOGGER.debug(f"{device.device_nfo.device_type} supports '{self.key}'")
-            except AttributeError:
+        try:
+            result = self.value(device)
+        except AttributeError:
+            if debug:
+                LOGGER.debug("%s DOES NOT support '%s'", device_type, self.key)
+            return False
+        if result is None:
+            if debug:
                 LOGGER.debug(
-                    f"{device.device_nfo.device_type} DOES NOT support '{self.key}'"
+                    "%s DOES NOT support '%s' (value is None)",
+                    device_type,
+                    self.key,
                 )
-                return False
+            return False
+        if debug:
+            LOGGER.debug("%s supports '%s'", device_type, self.key)
         return True
 
 
@@ -112,6 +165,9 @@ class PetkitEntity(
     """Petkit Entity class."""
 
     _attr_has_entity_name = True
+    _cached_unique_id: str | None = None
+    _device_info: DeviceInfo
+    _device_info_version: tuple[Any, ...] | None = None
 
     def __init__(
         self,
@@ -125,7 +181,6 @@ class PetkitEntity(
         """Initialize."""
         super().__init__(coordinator)
         self.device = device
-        self._attr_unique_id = coordinator.config_entry.entry_id
         self._attr_device_info = DeviceInfo(
             identifiers={
                 (
@@ -138,44 +193,19 @@ class PetkitEntity(
     @property
     def unique_id(self) -> str:
         """Return a unique ID for the binary_sensor."""
-        return f"{self.device.device_nfo.device_type}_{self.device.sn}_{self.entity_description.key}"
+        # Subclasses set entity_description after __init__, so build it on first use
+        if self._cached_unique_id is None:
+            self._cached_unique_id = f"{self.device.device_nfo.device_type}_{self.device.sn}_{self.entity_description.key}"
+        return self._cached_unique_id
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return the device information."""
-
-        if self.device.device_nfo.device_type:
-            device_type = self.device.device_nfo.device_type
-            device_model = PETKIT_DEVICES_MAPPING.get(
-                str(self.device.device_nfo.type_code) + str(device_type.lower()),
-                "Unknown Device",
-            )
-        else:
-            device_type = "Unknown"
-            device_model = "Unknown Device"
-
-        device_info = DeviceInfo(
-            identifiers={(DOMAIN, self.device.sn)},
-            manufacturer="Petkit",
-            model=device_model,
-            model_id=device_type.upper(),
-            name=self.device.name,
-        )
-
-        if not isinstance(self.device, Pet):
-            if self.device.mac is not None:
-                device_info["connections"] = {(CONNECTION_NETWORK_MAC, self.device.mac)}
-
-            if self.device.firmware is not None:
-                device_info["sw_version"] = str(self.device.firmware)
-
-            if self.device.hardware is not None:
-                device_info["hw_version"] = str(self.device.hardware)
-
-            if self.device.sn is not None:
-                device_info["serial_number"] = str(self.device.sn)
-
-        return device_info
+        """Return the device information, rebuilt only when it changes."""
+        version = _device_info_version(self.device)
+        if version != self._device_info_version:
+            self._device_info = _build_device_info(self.device)
+            self._device_info_version = version
+        return self._device_info
 
 
 class PetkitCameraBaseEntity(
@@ -189,6 +219,8 @@ class PetkitCameraBaseEntity(
     _attr_name = None
     _attr_is_streaming = True
     _attr_supported_features = CameraEntityFeature.STREAM
+    _device_info: DeviceInfo
+    _device_info_version: tuple[Any, ...] | None = None
 
     def __init__(
         self,
@@ -205,38 +237,11 @@ class PetkitCameraBaseEntity(
             f"{self.device.device_nfo.device_type}_{self.device.sn}_{key}"
         )
 
-    @property
-    def unique_id(self) -> str:
-        """Return the entity unique ID."""
-        return self._attr_unique_id
-
     @property
     def device_info(self) -> DeviceInfo:
-        """Return the device information."""
-        device_type = self.device.device_nfo.device_type or "Unknown"
-        device_model = PETKIT_DEVICES_MAPPING.get(
-            str(self.device.device_nfo.type_code) + str(device_type.lower()),
-            "Unknown Device",
-        )
-
-        device_info = DeviceInfo(
-            identifiers={(DOMAIN, self.device.sn)},
-            manufacturer="Petkit",
-            model=device_model,
-            model_id=device_type.upper(),
-            name=self.device.name,
-        )
-
-        if self.device.mac is not None:
-            device_info["connections"] = {(CONNECTION_NETWORK_MAC, self.device.mac)}
-
-        if self.device.firmware is not None:
-            device_info["sw_version"] = str(self.device.firmware)
-
-        if self.device.hardware is not None:
-            device_info["hw_version"] = str(self.device.hardware)
-
-        if self.device.sn is not None:
-            device_info["serial_number"] = str(self.device.sn)
-
-        return device_info
+        """Return the device information, rebuilt only when it changes."""
+        version = _device_info_version(self.device)
+        if version != self._device_info_version:
+            self._device_info = _build_device_info(self.device)
+            self._device_info_version = version
+        return self._device_info
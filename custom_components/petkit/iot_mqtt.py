@@ -16,6 +16,7 @@ from datetime import datetime
 from enum import StrEnum
 import hashlib
 import hmac
+from itertools import islice
 import json
 import re
 from typing import Any
@@ -449,12 +450,15 @@ class PetkitIotMqttListener:
         self, *, limit: int = 1, topic_contains: str | None = None
     ) -> list[dict]:
         """Return up to `limit` most recent messages, optionally filtered by topic substring."""
-        msgs = list(self._recent_messages)
-        if topic_contains:
-            msgs = [m for m in msgs if topic_contains in m.get("topic", "")]
         if limit <= 0:
             return []
-        return msgs[-limit:]
+        # Walk newest-first so only the requested messages are visited
+        msgs = reversed(self._recent_messages)
+        if topic_contains:
+            msgs = (m for m in msgs if topic_contains in m.get("topic", ""))
+        recent = list(islice(msgs, limit))
+        recent.reverse()
+        return recent
 
     def _schedule_refresh(self) -> None:
         if self._refresh_task is not None and not self._refresh_task.done():
@@ -60,8 +60,9 @@ class PetkitMediaSource(MediaSource):
 
     def get_coordinator(self):
         """Retrieve the integration's coordinator."""
-        if DOMAIN in self.hass.data and COORDINATOR in self.hass.data[DOMAIN]:
-            return self.hass.data[DOMAIN][COORDINATOR]
+        for entry_data in self.hass.data.get(DOMAIN, {}).values():
+            if COORDINATOR in entry_data:
+                return entry_data[COORDINATOR]
         LOGGER.error("Petkit coordinator not found in hass.data.")
         return None
 
@@ -215,11 +215,6 @@ class PetkitNumber(PetkitEntity, NumberEntity):
         self.entity_description = entity_description
         self.device = device
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID for the binary_sensor."""
-        return f"{self.device.device_nfo.device_type}_{self.device.sn}_{self.entity_description.key}"
-
     @property
     def entity_picture(self) -> str | None:
         """Grab associated pet picture."""
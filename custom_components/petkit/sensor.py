@@ -843,11 +843,6 @@ class PetkitSensorBt(PetkitEntity, SensorEntity):
             return device_data
         return None
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID for the Bluetooth sensor."""
-        return f"{self.device.device_nfo.device_type}_{self.device.sn}_{self.entity_description.key}"
-
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return the unit of measurement."""
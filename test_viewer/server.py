@@ -8,7 +8,7 @@ Usage:
     python server.py --ha-url http://192.168.1.28:8123 --ha-token YOUR_LONG_LIVED_TOKEN
 
 Dependencies:
-    pip install aiohttp rankjie-pypetkitapi websockets sdp-transform webrtc-models
+    pip install aiohttp rankjie-pypetkitapi websockets webrtc-models
 
 The server imports agora modules from ../custom_components/petkit via sys.path shimming.
 """
@@ -232,7 +232,8 @@ async def handle_start(request: web.Request) -> web.Response:
         for s in ice_servers_raw
     ]
 
-    # RTM start_live
+    # RTM start_live; a previous stream's session must not be leaked
+    await _close_stream()
     _rtm = AgoraRTMSignaling(AGORA_APP_ID)
     rtm_ok = await _rtm.start_live(live_feed)
 
@@ -305,20 +306,33 @@ async def handle_candidate(request: web.Request) -> web.Response:
     return web.json_response({"ok": True})
 
 
-async def handle_stop(request: web.Request) -> web.Response:
-    """Stop live stream and clean up."""
-    global _rtm, _ws_handler, _agora_response, _live_feed
+async def _close_stream() -> None:
+    """Stop signaling, close the websocket and release the RTM HTTP session."""
+    global _rtm, _ws_handler
+
+    async def _close_rtm(rtm: AgoraRTMSignaling) -> None:
+        try:
+            await rtm.stop_live(send_stop=True)
+        finally:
+            await rtm.async_close()
 
     tasks = []
     if _ws_handler:
         tasks.append(_ws_handler.disconnect())
     if _rtm:
-        tasks.append(_rtm.stop_live(send_stop=True))
+        tasks.append(_close_rtm(_rtm))
     if tasks:
         await asyncio.gather(*tasks, return_exceptions=True)
 
     _ws_handler = None
     _rtm = None
+
+
+async def handle_stop(request: web.Request) -> web.Response:
+    """Stop live stream and clean up."""
+    global _agora_response, _live_feed
+
+    await _close_stream()
     _agora_response = None
     _live_feed = None
 
@@ -328,13 +342,7 @@ async def handle_stop(request: web.Request) -> web.Response:
 
 async def on_shutdown(app: web.Application) -> None:
     global _http_session
-    tasks = []
-    if _ws_handler:
-        tasks.append(_ws_handler.disconnect())
-    if _rtm:
-        tasks.append(_rtm.stop_live(send_stop=True))
-    if tasks:
-        await asyncio.gather(*tasks, return_exceptions=True)
+    await _close_stream()
     if _http_session and not _http_session.closed:
         await _http_session.close()
         _http_session = None